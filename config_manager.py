@@ -3,13 +3,13 @@ Config Manager - Hot-reloading configuration system with file watching
 Manages config.json with live updates and dependency injection to other modules
 """
 
-import json
 import asyncio
 import aiofiles
 from pathlib import Path
 from typing import Dict, Any, Callable, Optional
 from dataclasses import dataclass, field
 import time
+import fast_json
 
 
 @dataclass
@@ -86,7 +86,7 @@ class ConfigManager:
                 
             async with aiofiles.open(self.config_path, 'r') as f:
                 content = await f.read()
-                data = json.loads(content)
+                data = fast_json.loads(content)
                 
             self.config = Config(
                 mode=data.get("mode", "demo"),
@@ -128,7 +128,7 @@ class ConfigManager:
         }
         
         async with aiofiles.open(self.config_path, 'w') as f:
-            await f.write(json.dumps(default_config, indent=2))
+            await f.write(fast_json.dumps(default_config, indent=True))
         
         self.config = Config(**default_config)
         await self._notify_subscribers()
@@ -186,7 +186,7 @@ class ConfigManager:
             current_data.update(updates)
             
             async with aiofiles.open(self.config_path, 'w') as f:
-                await f.write(json.dumps(current_data, indent=2))
+                await f.write(fast_json.dumps(current_data, indent=True))
             
             await self._load_config()
     
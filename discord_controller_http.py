@@ -5,13 +5,114 @@ Handles commands, sends alerts, and provides trading statistics via Discord
 
 import asyncio
 import os
+import re
+import time
 from typing import Optional, Dict, Any, Callable, List
-from datetime import datetime
 from discord_http_client import SimpleDiscordClient, DiscordEmbed, DiscordColor
 from config_manager import Config
 from error_handler import get_error_handler
 
 
+# Channel ID as int() accepts it, minus Unicode digits and doubled signs
+_CHANNEL_ID_RE = re.compile(r'-?\d+', re.ASCII)
+
+# Discord's per-message content limit
+DISCORD_MESSAGE_LIMIT = 2000
+
+# Notifications coalesced into one DM: flush at this many, or this long after the first arrives
+BATCH_MAX_SIZE = 8
+BATCH_MAX_WAIT = 0.25
+
+# Separator between coalesced notifications
+BATCH_SEPARATOR = "\n---\n"
+
+
+class DiscordMessageBatcher:
+    """Coalesces outbound notifications so a burst costs one DM round trip instead of several"""
+    
+    def __init__(self, send: Callable[[str], Any], max_batch_size: int = BATCH_MAX_SIZE,
+                 max_wait: float = BATCH_MAX_WAIT):
+        self._send = send
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self._task: Optional[asyncio.Task] = None
+    
+    def start(self) -> None:
+        """Start the background flush loop"""
+        if self._task is None:
+            self._task = asyncio.create_task(self.run())
+    
+    async def stop(self) -> None:
+        """Flush whatever is queued, then stop the loop"""
+        if self._task is None:
+            return
+        # Sentinel lets the loop send everything queued ahead of it before exiting
+        await self._queue.put(None)
+        await self._task
+        self._task = None
+    
+    async def process(self, text: str) -> asyncio.Future:
+        """Queue a notification; the returned future resolves to whether it was delivered"""
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((text, future))
+        return future
+    
+    async def run(self) -> None:
+        """Collect notifications into batches and send each batch as one message"""
+        loop = asyncio.get_running_loop()
+        while True:
+            item = await self._queue.get()
+            if item is None:
+                return
+            batch = [item]
+            deadline = loop.time() + self.max_wait
+            stopping = False
+            
+            while len(batch) < self.max_batch_size:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    item = await asyncio.wait_for(self._queue.get(), timeout)
+                except asyncio.TimeoutError:
+                    break
+                if item is None:
+                    stopping = True
+                    break
+                batch.append(item)
+            
+            await self._flush(batch)
+            if stopping:
+                return
+    
+    async def _flush(self, batch: List[tuple]) -> None:
+        """Send a batch, splitting it only where the joined text would pass the message limit"""
+        group: List[tuple] = []
+        length = 0
+        for item in batch:
+            added = len(item[0]) + (len(BATCH_SEPARATOR) if group else 0)
+            if group and length + added > DISCORD_MESSAGE_LIMIT:
+                await self._send_group(group)
+                group, length = [], 0
+                added = len(item[0])
+            group.append(item)
+            length += added
+        if group:
+            await self._send_group(group)
+    
+    async def _send_group(self, group: List[tuple]) -> None:
+        """Send one combined message and resolve its callers' futures"""
+        try:
+            sent = bool(await self._send(BATCH_SEPARATOR.join(text for text, _ in group)))
+        except Exception as e:
+            get_error_handler().handle_exception(e, "sending batched Discord notifications")
+            sent = False
+        for _, future in group:
+            if not future.done():
+                future.set_result(sent)
+
+
 class DiscordControllerHTTP:
     """HTTP-based Discord controller compatible with Termux"""
     
@@ -28,17 +129,20 @@ class DiscordControllerHTTP:
         else:
             self.authorized_users = []
         
-        self.monitored_channel_ids = [int(ch) for ch in os.getenv("MONITORED_CHANNEL_IDS", "").split(",") if ch.strip()]
+        env_channels = [ch.strip() for ch in os.getenv("MONITORED_CHANNEL_IDS", "").split(",") if ch.strip()]
+        config_channels = [str(ch).strip() for ch in (getattr(config, 'discord_channels', None) or [])]
         
-        # Add config-based channels to monitored channels
-        if hasattr(config, 'discord_channels') and config.discord_channels:
-            for ch in config.discord_channels:
-                try:
-                    channel_id = int(ch)
-                    if channel_id not in self.monitored_channel_ids:
-                        self.monitored_channel_ids.append(channel_id)
-                except ValueError:
-                    self.error_handler.log_warning(f"Invalid channel ID in config: {ch}")
+        # Pattern pre-check instead of try/int per entry; bad config entries are reported together
+        valid = [ch for ch in config_channels if _CHANNEL_ID_RE.fullmatch(ch)]
+        invalid = [ch for ch in config_channels if not _CHANNEL_ID_RE.fullmatch(ch)]
+        if invalid:
+            self.error_handler.log_warning(f"Invalid channel IDs in config: {', '.join(invalid)}")
+        
+        # Env channels first, then config channels, de-duplicated in order and assigned in one step
+        self.monitored_channel_ids = list(dict.fromkeys(
+            [int(ch) for ch in env_channels] +
+            [int(ch) for ch in valid]
+        ))
         
         print(f"🔧 Discord Controller initialized with monitored channels: {self.monitored_channel_ids}")
         print(f"👤 Authorized users: {self.authorized_users}")
@@ -47,6 +151,7 @@ class DiscordControllerHTTP:
         self.cancel_all_callback: Optional[Callable] = None
         self.get_positions_callback: Optional[Callable] = None
         self.get_stats_callback: Optional[Callable] = None
+        self.get_dashboard_callback: Optional[Callable] = None
         self.signal_callback: Optional[Callable] = None
         
         self.discord_token = os.getenv("DISCORD_TOKEN")
@@ -125,6 +230,22 @@ class DiscordControllerHTTP:
                 )
                 
                 embed = DiscordEmbed("📊 Bot Status", status_text, DiscordColor.BLUE)
+                
+                # Positions and stats come back from one batched callback
+                if self.get_dashboard_callback:
+                    positions_text, stats = await self.get_dashboard_callback()
+                    embed.add_field(name="Positions", value=positions_text[:1024], inline=False)
+                    if stats:
+                        embed.add_field(
+                            name="Statistics",
+                            value=(
+                                f"Trades: {stats.get('total_trades', 0)} | "
+                                f"PnL: {stats.get('total_pnl', 0):+.2f} USDT | "
+                                f"Win Rate: {stats.get('win_rate', 0):.1f}%"
+                            ),
+                            inline=False
+                        )
+                
                 dm_channel = await self.client._create_dm_channel(message.author.id)
                 if dm_channel:
                     await self.client._send_message(dm_channel, embed=embed)
@@ -174,7 +295,7 @@ class DiscordControllerHTTP:
         async def handle_health(message, args):
             """Show system health"""
             health_text = (
-                f"Timestamp: {datetime.now().strftime('%H:%M:%S')}\\n"
+                f"Timestamp: {time.strftime('%H:%M:%S')}\\n"
                 f"Config: ✅ Loaded\\n"
                 f"Exchange: ✅ Connected\\n"
                 f"Discord: ✅ Connected\\n"
@@ -388,11 +509,15 @@ Commands work via DM only."""
         """Set callback for getting statistics"""
         self.get_stats_callback = callback
     
+    def set_get_dashboard_callback(self, callback: Callable) -> None:
+        """Set callback for getting positions and statistics together"""
+        self.get_dashboard_callback = callback
+    
     def set_signal_callback(self, callback: Callable) -> None:
         """Set callback for signal processing"""
         self.signal_callback = callback
         self.client.set_signal_callback(callback)
-        print("✅ Signal callback set: True")
+        self.error_handler.log_debug("Signal callback set")
     
     async def send_message(self, text: str) -> bool:
         """Send DM message to all authorized users"""
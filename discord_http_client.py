@@ -8,7 +8,17 @@ import json
 import time
 from typing import Dict, List, Optional, Callable, Any
 import requests
+from requests.adapters import HTTPAdapter
 from datetime import datetime
+import fast_json
+
+
+# Inbound message pipeline sizing; each worker owns one shard of the queue capacity
+MESSAGE_QUEUE_SIZE = 256
+MESSAGE_WORKER_COUNT = 4
+
+# Keep-alive pool for the Discord REST API; sized for polling plus concurrent DMs
+HTTP_POOL_MAXSIZE = 10
 
 
 class DiscordColor:
@@ -107,10 +117,17 @@ class DiscordMessage:
 class SimpleDiscordClient:
     """Pure HTTP Discord client compatible with Termux"""
     
+    __slots__ = (
+        'token', 'authorized_users', 'monitored_channels', '_monitored_channel_set', 'base_url', 'headers',
+        'user', 'guilds', 'channels', 'signal_callback', '_signal_is_coro', 'commands',
+        '_running', '_last_message_id', '_message_queues', '_workers', 'session', '_dm_channels'
+    )
+    
     def __init__(self, token: str, authorized_users: List[int], monitored_channels: List[int]):
         self.token = token
         self.authorized_users = authorized_users
         self.monitored_channels = monitored_channels
+        self._monitored_channel_set = frozenset(monitored_channels)
         self.base_url = "https://discord.com/api/v10"
         self.headers = {
             "Authorization": f"Bot {token}",
@@ -118,6 +135,13 @@ class SimpleDiscordClient:
             "User-Agent": "DiscordBot (https://github.com/discord/discord-api-docs, 1.0)"
         }
         
+        # One pooled session so every call reuses a warm TLS connection
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        self.session.mount('https://', HTTPAdapter(pool_maxsize=HTTP_POOL_MAXSIZE))
+        # user id -> DM channel id; Discord returns the same channel for a recipient every time
+        self._dm_channels: Dict[int, int] = {}
+        
         # Bot info
         self.user = None
         self.guilds = []
@@ -125,17 +149,24 @@ class SimpleDiscordClient:
         
         # Callbacks
         self.signal_callback: Optional[Callable] = None
+        self._signal_is_coro = False
         self.commands = {}
         
         # Gateway simulation
         self._running = False
         self._last_message_id = {}  # Per channel
         
+        # Inbound messages are handled by a worker pool so slow handlers don't stall polling.
+        # Each channel always maps to the same worker's queue, so a signal and its follow-up
+        # from one channel are handled in order while different channels run in parallel.
+        self._message_queues: List[asyncio.Queue] = []
+        self._workers: List[asyncio.Task] = []
+        
     async def initialize(self):
         """Initialize the Discord client"""
         try:
             # Get bot user info
-            response = requests.get(f"{self.base_url}/users/@me", headers=self.headers)
+            response = await asyncio.to_thread(self.session.get, f"{self.base_url}/users/@me")
             if response.status_code == 200:
                 user_data = response.json()
                 self.user = DiscordUser(user_data)
@@ -149,8 +180,13 @@ class SimpleDiscordClient:
             # Get channel info for monitored channels
             await self._fetch_channel_info()
             
-            # Start message polling
+            # Start message workers and polling
             self._running = True
+            self._message_queues = [
+                asyncio.Queue(maxsize=MESSAGE_QUEUE_SIZE // MESSAGE_WORKER_COUNT)
+                for _ in range(MESSAGE_WORKER_COUNT)
+            ]
+            self._workers = [asyncio.create_task(self._message_worker(queue)) for queue in self._message_queues]
             asyncio.create_task(self._poll_messages())
             
         except Exception as e:
@@ -160,12 +196,20 @@ class SimpleDiscordClient:
     async def shutdown(self):
         """Shutdown the client"""
         self._running = False
+        
+        for worker in self._workers:
+            worker.cancel()
+        if self._workers:
+            await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+        self.session.close()
+        
         print("✅ Discord HTTP client shutdown")
     
     async def _fetch_guilds(self):
         """Fetch guild information"""
         try:
-            response = requests.get(f"{self.base_url}/users/@me/guilds", headers=self.headers)
+            response = await asyncio.to_thread(self.session.get, f"{self.base_url}/users/@me/guilds")
             if response.status_code == 200:
                 guilds_data = response.json()
                 self.guilds = [DiscordGuild(guild) for guild in guilds_data]
@@ -177,17 +221,32 @@ class SimpleDiscordClient:
     
     async def _fetch_channel_info(self):
         """Fetch information for monitored channels"""
+        # Single pass: confirmed and inaccessible channels are collected together
+        found_channels = []
+        missing_channels = []
+        missing_count = 0
+        
         for channel_id in self.monitored_channels:
             try:
-                response = requests.get(f"{self.base_url}/channels/{channel_id}", headers=self.headers)
+                response = await asyncio.to_thread(self.session.get, f"{self.base_url}/channels/{channel_id}")
                 if response.status_code == 200:
-                    channel_data = response.json()
-                    self.channels[channel_id] = DiscordChannel(channel_data)
-                    print(f"✅ Channel access confirmed: #{self.channels[channel_id].name} ({channel_id})")
-                else:
-                    print(f"❌ Cannot access channel {channel_id}: {response.status_code}")
+                    channel = DiscordChannel(response.json())
+                    self.channels[channel_id] = channel
+                    found_channels.append(f"#{channel.name} ({channel_id})")
+                    continue
+                reason = str(response.status_code)
             except Exception as e:
-                print(f"❌ Error fetching channel {channel_id}: {e}")
+                reason = str(e)
+            
+            missing_count += 1
+            if missing_count <= 10:
+                missing_channels.append(f"{channel_id} ({reason})")
+        
+        if found_channels:
+            print(f"✅ Channel access confirmed: {', '.join(found_channels)}")
+        if missing_channels:
+            extra = f" (+{missing_count - 10} more)" if missing_count > 10 else ""
+            print(f"❌ Cannot access channels: {', '.join(missing_channels)}{extra}")
     
     async def _poll_messages(self):
         """Poll messages from monitored channels"""
@@ -212,28 +271,36 @@ class SimpleDiscordClient:
             if channel_id in self._last_message_id:
                 params["after"] = self._last_message_id[channel_id]
             
-            response = requests.get(
+            response = await asyncio.to_thread(
+                self.session.get,
                 f"{self.base_url}/channels/{channel_id}/messages",
-                headers=self.headers,
                 params=params
             )
             
             if response.status_code == 200:
-                messages = response.json()
+                messages = fast_json.loads(response.content)
+                
+                # Bind hot-path lookups once per batch
+                bot_id = self.user.id
+                last_message_id = self._last_message_id
+                enqueue = self._message_queues[channel_id % MESSAGE_WORKER_COUNT].put_nowait
                 
                 # Process messages in chronological order (oldest first)
                 for message_data in reversed(messages):
                     message = DiscordMessage(message_data, self)
                     
                     # Skip bot's own messages
-                    if message.author.id == self.user.id:
+                    if message.author.id == bot_id:
                         continue
                     
                     # Update last seen message ID
-                    self._last_message_id[channel_id] = message.id
+                    last_message_id[channel_id] = message.id
                     
-                    # Process the message
-                    await self._handle_message(message)
+                    # Hand off to this channel's worker
+                    try:
+                        enqueue(message)
+                    except asyncio.QueueFull:
+                        print(f"⚠️ Message queue full, dropping message {message.id} from {channel_id}")
                     
             elif response.status_code == 429:  # Rate limited
                 retry_after = response.json().get("retry_after", 5)
@@ -245,23 +312,48 @@ class SimpleDiscordClient:
         except Exception as e:
             print(f"❌ Error checking messages in channel {channel_id}: {e}")
     
+    async def _message_worker(self, queue: asyncio.Queue):
+        """Drain one shard of the inbound message queue, one message at a time"""
+        handle_message = self._handle_message
+        
+        while True:
+            message = await queue.get()
+            try:
+                await handle_message(message)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                print(f"❌ Error handling message {message.id}: {e}")
+            finally:
+                queue.task_done()
+    
     async def _handle_message(self, message: DiscordMessage):
         """Handle incoming message"""
-        print(f"📨 New message from {message.author} in {message.channel_id}")
+        content = message.content
+        
+        # Nothing to parse or dispatch for empty messages (joins, pins, embed-only posts)
+        if not content and not message.attachments:
+            return
+        
+        channel_id = message.channel_id
+        print(f"📨 New message from {message.author} in {channel_id}")
         
         # Check if it's a DM or from monitored channel
-        if message.channel_id in self.monitored_channels:
-            print(f"🎯 Processing signal from monitored channel {message.channel_id}")
+        if channel_id in self._monitored_channel_set:
+            print(f"🎯 Processing signal from monitored channel {channel_id}")
             await self._process_signal_message(message)
         
         # Process commands (simple prefix check)
-        if message.content.startswith("!"):
+        if content.startswith("!"):
             await self._process_command(message)
     
     async def _process_signal_message(self, message: DiscordMessage):
         """Process signal message from monitored channels"""
         try:
-            if self.signal_callback:
+            signal_callback = self.signal_callback
+            if signal_callback:
+                channel_id = message.channel_id
+                
                 # Extract image URLs from attachments
                 images = []
                 for attachment in message.attachments:
@@ -269,11 +361,14 @@ class SimpleDiscordClient:
                         images.append(attachment["url"])
                 
                 # Get source info
-                channel_name = self.channels.get(message.channel_id)
-                source = f"#{channel_name.name}" if channel_name else f"Channel {message.channel_id}"
+                channel_name = self.channels.get(channel_id)
+                source = f"#{channel_name.name}" if channel_name else f"Channel {channel_id}"
                 
                 # Forward to signal processor
-                await self.signal_callback(message.content, images, source)
+                if self._signal_is_coro:
+                    await signal_callback(message.content, images, source)
+                else:
+                    signal_callback(message.content, images, source)
                 
                 # Send DM to authorized users
                 await self._send_signal_dm(message, source, images)
@@ -408,17 +503,21 @@ Some advanced features may be limited."""
                 print(f"❌ Failed to send security alert to {user_id}: {e}")
     
     async def _create_dm_channel(self, user_id: int) -> Optional[int]:
-        """Create DM channel with user"""
+        """Create DM channel with user (cached after the first call)"""
+        channel_id = self._dm_channels.get(user_id)
+        if channel_id is not None:
+            return channel_id
+        
         try:
-            response = requests.post(
+            response = await asyncio.to_thread(
+                self.session.post,
                 f"{self.base_url}/users/@me/channels",
-                headers=self.headers,
                 json={"recipient_id": str(user_id)}
             )
             
             if response.status_code == 200:
-                channel_data = response.json()
-                return int(channel_data["id"])
+                channel_id = self._dm_channels[user_id] = int(response.json()["id"])
+                return channel_id
             else:
                 print(f"❌ Failed to create DM channel with user {user_id}: {response.status_code}")
                 return None
@@ -436,9 +535,9 @@ Some advanced features may be limited."""
             if embed:
                 payload["embeds"] = [embed.to_dict()]
             
-            response = requests.post(
+            response = await asyncio.to_thread(
+                self.session.post,
                 f"{self.base_url}/channels/{channel_id}/messages",
-                headers=self.headers,
                 json=payload
             )
             
@@ -459,29 +558,33 @@ Some advanced features may be limited."""
     
     async def send_message_to_users(self, text: str) -> bool:
         """Send message to all authorized users"""
-        sent_count = 0
-        
         # Split long messages
         chunks = [text[i:i+2000] for i in range(0, len(text), 2000)]
         
-        for user_id in self.authorized_users:
+        async def send_to_user(user_id: int) -> int:
+            sent_count = 0
             try:
                 dm_channel = await self._create_dm_channel(user_id)
                 if not dm_channel:
-                    continue
+                    return 0
                 
+                # Chunks stay sequential so a user sees them in order
                 for chunk in chunks:
                     if await self._send_message(dm_channel, content=chunk):
                         sent_count += 1
                         
             except Exception as e:
                 print(f"❌ Failed to send message to user {user_id}: {e}")
+            return sent_count
         
-        return sent_count > 0
+        # Users are independent - deliver to all of them at once over the pooled session
+        sent_counts = await asyncio.gather(*(send_to_user(user_id) for user_id in self.authorized_users))
+        return sum(sent_counts) > 0
     
     def set_signal_callback(self, callback: Callable):
         """Set signal processing callback"""
         self.signal_callback = callback
+        self._signal_is_coro = asyncio.iscoroutinefunction(callback)
         print("✅ Signal callback set")
     
     def register_command(self, command: str, handler: Callable):
@@ -6,9 +6,11 @@ Routes logs to terminal with emoji prioritization and sends critical errors to T
 import asyncio
 import logging
 import sys
+import time
 import traceback
+from collections import OrderedDict
 from datetime import datetime
-from typing import Optional, Callable, Any
+from typing import Optional, Callable, Any, Set
 from enum import Enum
 
 
@@ -20,10 +22,75 @@ class LogLevel(Enum):
     DEBUG = "🔍"
 
 
+SUCCESS_LEVEL = 25
+logging.addLevelName(SUCCESS_LEVEL, "SUCCESS")
+
+# Repeated exceptions are logged once per window; repeats are summarized when it closes
+ERROR_DEDUP_WINDOW = 60.0
+ERROR_DEDUP_MAX_KEYS = 256
+
+_LEVEL_EMOJI = {
+    logging.DEBUG: LogLevel.DEBUG.value,
+    logging.INFO: LogLevel.INFO.value,
+    SUCCESS_LEVEL: LogLevel.SUCCESS.value,
+    logging.WARNING: LogLevel.WARNING.value,
+    logging.ERROR: LogLevel.ERROR.value,
+    logging.CRITICAL: LogLevel.ERROR.value,
+}
+
+
+class EmojiFormatter(logging.Formatter):
+    """Formatter that adds the level emoji at format time"""
+    
+    def __init__(self, fmt: Optional[str] = None, datefmt: Optional[str] = None):
+        super().__init__(fmt, datefmt)
+        self._last_second: Optional[int] = None
+        self._last_time_str = ""
+    
+    def formatTime(self, record: logging.LogRecord, datefmt: Optional[str] = None) -> str:
+        """Format record time, reusing the string for records within the same second"""
+        second = int(record.created)
+        if second != self._last_second:
+            self._last_second = second
+            self._last_time_str = time.strftime(datefmt or '%H:%M:%S', self.converter(second))
+        return self._last_time_str
+    
+    def format(self, record: logging.LogRecord) -> str:
+        record.emoji = _LEVEL_EMOJI.get(record.levelno, "")
+        return super().format(record)
+
+
+# Strong references to fire-and-forget notification tasks until they finish
+_BG_TASKS: Set[asyncio.Task] = set()
+
+
+def _log_task_exception(task: asyncio.Task) -> None:
+    """Surface exceptions from background notification tasks"""
+    if task.cancelled():
+        return
+    exception = task.exception()
+    if exception is not None:
+        logging.getLogger("trading_bot").error(f"Failed to send message to Telegram: {exception}")
+
+
+def _spawn(coro) -> asyncio.Task:
+    """Start a background task that is tracked until done and reports its failure"""
+    task = asyncio.create_task(coro)
+    _BG_TASKS.add(task)
+    task.add_done_callback(_BG_TASKS.discard)
+    task.add_done_callback(_log_task_exception)
+    return task
+
+
 class ErrorHandler:
+    __slots__ = ('telegram_callback', '_telegram_is_coro', 'logger', '_error_counts')
+    
     def __init__(self):
         self.telegram_callback: Optional[Callable] = None
+        self._telegram_is_coro = False
         self.logger = self._setup_logger()
+        # (context, exception type, message) -> [suppressed count, window start]
+        self._error_counts: OrderedDict = OrderedDict()
         
     def _setup_logger(self) -> logging.Logger:
         """Setup structured logging with emoji prioritization"""
@@ -36,8 +103,8 @@ class ErrorHandler:
         console_handler = logging.StreamHandler(sys.stdout)
         console_handler.setLevel(logging.DEBUG)
         
-        formatter = logging.Formatter(
-            '%(asctime)s | %(levelname)s | %(message)s',
+        formatter = EmojiFormatter(
+            '%(asctime)s | %(levelname)s | %(emoji)s %(message)s',
             datefmt='%H:%M:%S'
         )
         console_handler.setFormatter(formatter)
@@ -48,66 +115,98 @@ class ErrorHandler:
     def set_telegram_callback(self, callback: Callable[[str], None]) -> None:
         """Set callback for sending critical errors to Telegram"""
         self.telegram_callback = callback
+        self._telegram_is_coro = asyncio.iscoroutinefunction(callback)
     
     def log_success(self, message: str, notify_telegram: bool = False) -> None:
         """Log success message"""
-        formatted_msg = f"{LogLevel.SUCCESS.value} {message}"
-        self.logger.info(formatted_msg)
+        self.logger.log(SUCCESS_LEVEL, message)
         
         if notify_telegram and self.telegram_callback:
-            asyncio.create_task(self._send_to_telegram(formatted_msg))
+            _spawn(self._send_to_telegram(f"{LogLevel.SUCCESS.value} {message}"))
     
     def log_warning(self, message: str, notify_telegram: bool = False) -> None:
         """Log warning message"""
-        formatted_msg = f"{LogLevel.WARNING.value} {message}"
-        self.logger.warning(formatted_msg)
+        self.logger.warning(message)
         
         if notify_telegram and self.telegram_callback:
-            asyncio.create_task(self._send_to_telegram(formatted_msg))
+            _spawn(self._send_to_telegram(f"{LogLevel.WARNING.value} {message}"))
     
     def log_error(self, message: str, exception: Optional[Exception] = None, 
                   notify_telegram: bool = True) -> None:
         """Log error message with optional exception details"""
-        formatted_msg = f"{LogLevel.ERROR.value} {message}"
-        
         if exception:
-            formatted_msg += f"\nException: {str(exception)}"
-            self.logger.error(formatted_msg, exc_info=True)
+            message = f"{message}\nException: {str(exception)}"
+            # Rendered inline so the traceback stays attached to its error line; passing the
+            # exception itself keeps it correct when called outside an except block
+            self.logger.error(message, exc_info=exception)
         else:
-            self.logger.error(formatted_msg)
+            self.logger.error(message)
         
         if notify_telegram and self.telegram_callback:
-            asyncio.create_task(self._send_to_telegram(formatted_msg))
+            _spawn(self._send_to_telegram(f"{LogLevel.ERROR.value} {message}"))
     
     def log_info(self, message: str, notify_telegram: bool = False) -> None:
         """Log info message"""
-        formatted_msg = f"{LogLevel.INFO.value} {message}"
-        self.logger.info(formatted_msg)
+        self.logger.info(message)
         
         if notify_telegram and self.telegram_callback:
-            asyncio.create_task(self._send_to_telegram(formatted_msg))
+            _spawn(self._send_to_telegram(f"{LogLevel.INFO.value} {message}"))
     
     def log_debug(self, message: str) -> None:
         """Log debug message (terminal only)"""
-        formatted_msg = f"{LogLevel.DEBUG.value} {message}"
-        self.logger.debug(formatted_msg)
+        self.logger.debug(message)
+    
+    @property
+    def debug_enabled(self) -> bool:
+        """Whether debug messages are emitted - check before building costly messages"""
+        return self.logger.isEnabledFor(logging.DEBUG)
+    
+    def set_log_level(self, level: str) -> None:
+        """Set the terminal log level by name (DEBUG, INFO, WARNING, ...)"""
+        self.logger.setLevel(getattr(logging, level.upper(), logging.DEBUG))
     
     async def _send_to_telegram(self, message: str) -> None:
         """Send message to Telegram with error handling"""
         if not self.telegram_callback:
             return
-            
-        try:
-            if asyncio.iscoroutinefunction(self.telegram_callback):
-                await self.telegram_callback(message)
-            else:
-                self.telegram_callback(message)
-        except Exception as e:
-            self.logger.error(f"Failed to send message to Telegram: {e}")
+        
+        # Failures are reported by the task's done callback
+        if self._telegram_is_coro:
+            await self.telegram_callback(message)
+        else:
+            self.telegram_callback(message)
     
     def handle_exception(self, exception: Exception, context: str = "", 
                         notify_telegram: bool = True) -> None:
         """Handle exceptions with full context"""
+        # Coalesce repeats of the same error within the dedup window
+        key = (context, type(exception).__name__, str(exception)[:120])
+        now = time.monotonic()
+        entry = self._error_counts.get(key)
+        
+        if entry is not None and now - entry[1] < ERROR_DEDUP_WINDOW:
+            entry[0] += 1
+            self._error_counts.move_to_end(key)
+            if entry[0] == 1:
+                # First repeat in this window - report the tally when the window closes,
+                # even if the error never happens again
+                try:
+                    asyncio.get_running_loop().call_later(
+                        ERROR_DEDUP_WINDOW - (now - entry[1]), self._flush_suppressed, key
+                    )
+                except RuntimeError:
+                    pass  # No loop (worker thread); flushed on the next occurrence or at shutdown
+            return
+        
+        suppressed = entry[0] if entry is not None else 0
+        self._error_counts[key] = [0, now]
+        self._error_counts.move_to_end(key)
+        if len(self._error_counts) > ERROR_DEDUP_MAX_KEYS:
+            self._error_counts.popitem(last=False)
+        
+        if suppressed:
+            context = f"{context} ({suppressed} repeats suppressed)"
+        
         error_msg = f"Exception in {context}: {str(exception)}"
         
         if isinstance(exception, (ConnectionError, TimeoutError)):
@@ -117,6 +216,20 @@ class ErrorHandler:
         else:
             self.log_error(error_msg, exception, notify_telegram)
     
+    def _flush_suppressed(self, key: tuple) -> None:
+        """Log how often an error repeated during its dedup window, then reset the tally"""
+        entry = self._error_counts.get(key)
+        if entry is None or not entry[0]:
+            return
+        context, error_type, message = key
+        self.log_warning(f"{context}: {error_type}: {message} ({entry[0]} repeats suppressed)")
+        entry[0] = 0
+    
+    def flush_suppressed(self) -> None:
+        """Report every pending suppressed-error tally (called at shutdown)"""
+        for key in list(self._error_counts):
+            self._flush_suppressed(key)
+    
     async def safe_execute(self, coro_func, context: str = "", 
                           retry_count: int = 0, max_retries: int = 5,
                           backoff_factor: float = 2.0, max_wait: float = 60.0) -> Any:
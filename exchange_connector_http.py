@@ -8,16 +8,56 @@ import json
 import os
 import time
 from typing import Dict, List, Optional, Any, Tuple, Callable
-from decimal import Decimal, ROUND_DOWN
 from datetime import datetime, timedelta
 from config_manager import Config
 from error_handler import get_error_handler
-from exchange_http_client import ExchangeClient, ExchangeError
+from exchange_http_client import ExchangeClient, ExchangeError, Order
+from fast_path import (parse_symbol_limits, floor_to_step, round_to_step, default_step, step_decimals,
+                       format_quantity, format_symbol, has_valid_base)
+
+
+# Symbol filters change rarely; refresh exchangeInfo at most every 5 minutes
+EXCHANGE_INFO_TTL = 300
+
+# Background refresh so synchronous sizing never runs on very old step sizes (6 hours)
+EXCHANGE_INFO_REFRESH_INTERVAL = 6 * 60 * 60
+
+# Seconds a fetched price is reused; short enough to size orders from, long enough to
+# absorb the back-to-back lookups of one signal or tracker tick
+PRICE_CACHE_TTL = 2.0
+
+# Conservative limits used when a symbol is missing from exchangeInfo
+DEFAULT_SYMBOL_LIMITS = {'min_qty': 0.001, 'max_qty': 0.0, 'step_size': 0.001, 'tick_size': 0.0, 'min_notional': 5.0}
+
+# Decimals a trigger price is rounded to when the symbol has no cached PRICE_FILTER tick
+DEFAULT_PRICE_DECIMALS = 8
+
+# Shared params for reduce-only futures TP/SL trigger orders; stopPrice is added per order
+_EXIT_ORDER_PARAMS = {
+    'reduceOnly': 'true',
+    'workingType': 'MARK_PRICE',
+    'timeInForce': 'GTE_GTC',
+    'priceProtect': 'TRUE',
+}
+
+# get_open_positions serves cached positions for this long (seconds)
+POSITIONS_TTL = 1.0
+
+# Resync the monotonic request clock with server time this often (seconds); -1021 also forces a resync
+TIME_SYNC_INTERVAL = 30 * 60
 
 
 class ExchangeConnectorHTTP:
     """HTTP-based exchange connector compatible with Termux"""
     
+    __slots__ = (
+        'config', 'error_handler', 'exchange', '_positions_cache', '_last_cache_update',
+        '_lock', '_time_offset', '_exchange_info_cache', '_exchange_info_ts',
+        '_normalize_cache', '_market_key_cache', '_step_cache', '_tick_cache', '_ticker_symbol_map', '_price_cache',
+        '_time_sync_task', '_exchange_info_task',
+        '_summary_signature', '_summary_text'
+    )
+    
     def __init__(self, config: Config):
         self.config = config
         self.error_handler = get_error_handler()
@@ -26,13 +66,29 @@ class ExchangeConnectorHTTP:
         self._last_cache_update = 0
         self._lock = asyncio.Lock()
         self._time_offset = 0
+        self._exchange_info_cache: Dict[str, Dict[str, float]] = {}
+        self._exchange_info_ts = 0.0
+        self._normalize_cache: Dict[Tuple[str, bool], str] = {}
+        self._market_key_cache: Dict[str, str] = {}
+        self._step_cache: Dict[str, Tuple[float, int]] = {}
+        self._tick_cache: Dict[str, Tuple[float, int]] = {}
+        self._ticker_symbol_map: Dict[str, str] = {}
+        # symbol -> (monotonic fetch time, price)
+        self._price_cache: Dict[str, Tuple[float, float]] = {}
+        self._time_sync_task: Optional[asyncio.Task] = None
+        self._exchange_info_task: Optional[asyncio.Task] = None
+        self._summary_signature: Optional[Tuple] = None
+        self._summary_text = ""
         
     async def initialize(self) -> None:
         """Initialize exchange connection"""
         try:
             await self._setup_exchange()
             await self._test_connection()
-            await self._reconcile_positions()
+            # Independent startup fetches - overlap them instead of paying each round trip in turn
+            await asyncio.gather(self._warm_exchange_info(), self._reconcile_positions())
+            self._time_sync_task = asyncio.create_task(self._sync_time_periodically())
+            self._exchange_info_task = asyncio.create_task(self._refresh_exchange_info_periodically())
             self.error_handler.log_startup("Exchange Connector HTTP")
         except Exception as e:
             self.error_handler.handle_exception(e, "exchange initialization")
@@ -40,8 +96,17 @@ class ExchangeConnectorHTTP:
     
     async def shutdown(self) -> None:
         """Gracefully shutdown exchange connection"""
+        for task in (self._time_sync_task, self._exchange_info_task):
+            if task:
+                task.cancel()
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
+        
         if self.exchange:
-            # HTTP client doesn't need explicit close
+            # Release the pooled keep-alive connections held by the shared session
+            self.exchange.close()
             self.error_handler.log_shutdown("Exchange Connector HTTP")
     
     async def _setup_exchange(self) -> None:
@@ -69,41 +134,66 @@ class ExchangeConnectorHTTP:
         """Test exchange connection and sync time"""
         try:
             # Test connectivity
-            if not self.exchange.test_connectivity():
+            if not await self.exchange.test_connectivity():
                 raise ExchangeError("Exchange connectivity test failed")
             
             print("✅ Exchange connection verified")
             
+            self._time_offset = await self.exchange.sync_time()
+            print(f"✅ Exchange time synced (offset: {self._time_offset}ms)")
+            
         except Exception as e:
             raise ExchangeError(f"Exchange connection test failed: {str(e)}")
     
+    async def _sync_time_periodically(self) -> None:
+        """Keep signed-request timestamps aligned with server time"""
+        while True:
+            try:
+                await asyncio.sleep(TIME_SYNC_INTERVAL)
+                self._time_offset = await self.exchange.sync_time()
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                self.error_handler.handle_exception(e, "syncing exchange time", notify_telegram=False)
+    
+    async def _refresh_exchange_info_periodically(self) -> None:
+        """Keep cached symbol filters current for synchronous sizing calls"""
+        while True:
+            try:
+                await asyncio.sleep(EXCHANGE_INFO_REFRESH_INTERVAL)
+                await self._load_exchange_info()
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                self.error_handler.handle_exception(e, "refreshing exchange info", notify_telegram=False)
+    
+    async def _warm_exchange_info(self) -> None:
+        """Preload symbol limits so the first order doesn't pay for the download"""
+        try:
+            limits_by_symbol = await self._load_exchange_info()
+            print(f"✅ Loaded exchange limits for {len(limits_by_symbol)} symbols")
+        except Exception as e:
+            self.error_handler.handle_exception(e, "loading exchange info")
+            print("⚠️ Exchange info preload failed - limits will be fetched on demand")
+    
     async def _reconcile_positions(self) -> None:
         """Reconcile positions on startup to detect existing trades"""
         try:
             print("🔄 Performing position reconciliation...")
             
             # Get current futures positions
-            positions = self.exchange.get_futures_positions()
-            
-            discrepancies = []
-            for position in positions:
-                symbol = position['symbol']
-                size = abs(position['size'])
-                
-                if size > 0.001:  # Ignore very small positions
-                    # Check if we have this position tracked
-                    if symbol not in self._positions_cache:
-                        discrepancies.append({
-                            'symbol': symbol,
-                            'size': position['size'],
-                            'side': position['side'],
-                            'pnl': position['pnl']
-                        })
-            
-            if discrepancies:
-                print(f"⚠️ Position reconciliation found {len(discrepancies)} discrepancies")
-                for disc in discrepancies:
-                    print(f"⚠️ Found untracked position: {disc['symbol']}")
+            positions = await self.exchange.get_futures_positions()
+            
+            # Ignore very small positions, then diff against tracked symbols in one set op
+            actual_symbols = {p['symbol'] for p in positions if abs(p['size']) > 0.001}
+            untracked = actual_symbols - self._positions_cache.keys()
+            
+            if untracked:
+                print(f"⚠️ Position reconciliation found {len(untracked)} discrepancies")
+                for symbol in sorted(untracked)[:5]:
+                    print(f"⚠️ Found untracked position: {symbol}")
+                if len(untracked) > 5:
+                    print(f"⚠️ ...and {len(untracked) - 5} more untracked positions")
             else:
                 print("✅ Position reconciliation complete - no discrepancies found")
             
@@ -111,10 +201,83 @@ class ExchangeConnectorHTTP:
             self.error_handler.handle_exception(e, "position reconciliation")
             print("⚠️ Position reconciliation failed - continuing anyway")
     
+    async def _load_exchange_info(self) -> Dict[str, Dict[str, float]]:
+        """Load futures symbol limits, refreshing the cached exchangeInfo after the TTL"""
+        if time.time() - self._exchange_info_ts < EXCHANGE_INFO_TTL:
+            return self._exchange_info_cache
+        
+        async with self._lock:
+            # Another caller may have refreshed while we waited for the lock
+            if time.time() - self._exchange_info_ts < EXCHANGE_INFO_TTL:
+                return self._exchange_info_cache
+            
+            data = await self.exchange.get_exchange_info(True)
+            limits_by_symbol = {s['symbol']: parse_symbol_limits(s) for s in data.get('symbols', [])}
+            
+            self._exchange_info_cache = limits_by_symbol
+            self._market_key_cache.clear()
+            self._step_cache.clear()
+            self._tick_cache.clear()
+            self._exchange_info_ts = time.time()
+            return limits_by_symbol
+    
+    async def get_binance_exchange_limits(self, symbol: str) -> Optional[Dict[str, float]]:
+        """Get LOT_SIZE and notional limits for a futures symbol"""
+        try:
+            limits_by_symbol = await self._load_exchange_info()
+            key = self._canonical_market_key(symbol)
+            return limits_by_symbol.get(key) if key else None
+        except Exception as e:
+            self.error_handler.handle_exception(e, f"getting exchange limits for {symbol}")
+            return None
+    
+    def _canonical_market_key(self, symbol: str) -> Optional[str]:
+        """Resolve a symbol to its exchangeInfo key once and remember the hit"""
+        key = self._market_key_cache.get(symbol)
+        if key is not None:
+            return key
+        
+        cache = self._exchange_info_cache
+        for candidate in (symbol, self.normalize_symbol(symbol, True), self.normalize_symbol(symbol, False)):
+            if candidate in cache:
+                self._market_key_cache[symbol] = candidate
+                return candidate
+        return None
+    
+    async def validate_order_size(self, symbol: str, quantity: float, price: float) -> Dict[str, Any]:
+        """Check quantity and notional against the symbol's exchange limits"""
+        warnings = []
+        limits = await self.get_binance_exchange_limits(symbol)
+        if not limits:
+            limits = DEFAULT_SYMBOL_LIMITS
+            warnings.append(f"No exchange limits for {symbol}, using defaults")
+        
+        min_qty = limits['min_qty']
+        max_qty = limits['max_qty']
+        min_notional = limits['min_notional']
+        notional = quantity * price
+        
+        errors = []
+        if quantity < min_qty:
+            errors.append(f"{symbol} quantity {quantity} below minimum {min_qty}")
+        if max_qty and quantity > max_qty:
+            errors.append(f"{symbol} quantity {quantity} above maximum {max_qty}")
+        if notional < min_notional:
+            errors.append(f"{symbol} notional ${notional:.2f} below minimum ${min_notional:.2f}")
+        
+        return {
+            'valid': not errors,
+            'errors': errors,
+            'warnings': warnings,
+            'min_qty': min_qty,
+            'min_notional': min_notional,
+            'notional': notional
+        }
+    
     async def get_balance(self, asset: str = "USDT") -> float:
         """Get balance for specified asset"""
         try:
-            balance_info = self.exchange.get_balance(asset)
+            balance_info = await self.exchange.get_balance(asset)
             return balance_info.get('free', 0.0)
         except Exception as e:
             self.error_handler.handle_exception(e, f"getting {asset} balance")
@@ -123,7 +286,7 @@ class ExchangeConnectorHTTP:
     async def get_futures_balance(self) -> float:
         """Get futures account balance"""
         try:
-            account = self.exchange.get_futures_account()
+            account = await self.exchange.get_futures_account()
             for asset in account.get('assets', []):
                 if asset['asset'] == 'USDT':
                     return float(asset['walletBalance'])
@@ -135,12 +298,51 @@ class ExchangeConnectorHTTP:
     async def get_price(self, symbol: str) -> float:
         """Get current price for symbol"""
         try:
-            ticker = self.exchange.get_ticker(symbol)
+            ticker = await self.exchange.get_ticker(symbol)
             return ticker['price']
         except Exception as e:
             self.error_handler.handle_exception(e, f"getting price for {symbol}")
             raise
     
+    async def get_current_price(self, symbol: str) -> float:
+        """Get current price, reusing a fetch from the last couple of seconds"""
+        cached = self._price_cache.get(symbol)
+        if cached is not None and time.monotonic() - cached[0] < PRICE_CACHE_TTL:
+            return cached[1]
+        
+        price = await self._fetch_current_price(symbol)
+        self._price_cache[symbol] = (time.monotonic(), price)
+        return price
+    
+    async def _fetch_current_price(self, symbol: str) -> float:
+        """Fetch the price, remembering which symbol variant the exchange accepts"""
+        get_ticker = self.exchange.get_ticker
+        ticker_symbol_map = self._ticker_symbol_map
+        resolved = ticker_symbol_map.get(symbol)
+        if resolved is not None:
+            try:
+                return (await get_ticker(resolved))['price']
+            except Exception:
+                # Drop the stale mapping and resolve again below
+                del ticker_symbol_map[symbol]
+        
+        candidates = [symbol]
+        for variant in (self.normalize_symbol(symbol, True), self.normalize_symbol(symbol, False)):
+            if variant not in candidates:
+                candidates.append(variant)
+        
+        last_error: Optional[Exception] = None
+        for candidate in candidates:
+            try:
+                price = (await get_ticker(candidate))['price']
+                ticker_symbol_map[symbol] = candidate
+                return price
+            except Exception as e:
+                last_error = e
+        
+        self.error_handler.handle_exception(last_error, f"getting current price for {symbol}")
+        raise last_error
+    
     async def create_order(self, symbol: str, side: str, order_type: str, 
                           amount: float, price: float = None, 
                           futures: bool = False, leverage: int = None) -> Dict:
@@ -149,11 +351,11 @@ class ExchangeConnectorHTTP:
             # Set leverage if specified and futures
             if futures and leverage:
                 try:
-                    self.exchange.set_leverage(symbol, leverage)
+                    await self.exchange.set_leverage(symbol, leverage)
                 except Exception as e:
                     print(f"⚠️ Failed to set leverage {leverage} for {symbol}: {e}")
             
-            order = self.exchange.create_order(
+            order = await self.exchange.create_order(
                 symbol=symbol,
                 side=side,
                 order_type=order_type,
@@ -161,6 +363,7 @@ class ExchangeConnectorHTTP:
                 price=price,
                 futures=futures
             )
+            self._invalidate_positions_cache()
             
             # Normalize order response
             normalized_order = {
@@ -181,10 +384,57 @@ class ExchangeConnectorHTTP:
             self.error_handler.handle_exception(e, f"creating {side} order for {symbol}")
             raise
     
+    async def place_take_profit_order(self, symbol: str, side: str, amount: float,
+                                      trigger_price: float) -> Optional[Dict]:
+        """Place reduce-only take profit market order"""
+        return await self._place_exit_order(symbol, side, amount, trigger_price, 'TAKE_PROFIT_MARKET')
+    
+    async def place_stop_loss_order(self, symbol: str, side: str, amount: float,
+                                    trigger_price: float) -> Optional[Dict]:
+        """Place reduce-only stop loss market order"""
+        return await self._place_exit_order(symbol, side, amount, trigger_price, 'STOP_MARKET')
+    
+    async def _place_exit_order(self, symbol: str, side: str, amount: float,
+                                trigger_price: float, order_type: str) -> Optional[Dict]:
+        """Place futures trigger order that can only reduce the position"""
+        try:
+            tick = self._get_tick(symbol)
+            if tick:
+                trigger_price = round_to_step(trigger_price, *tick)
+            else:
+                trigger_price = round(trigger_price, DEFAULT_PRICE_DECIMALS)
+            params = {**_EXIT_ORDER_PARAMS, 'stopPrice': format_quantity(trigger_price)}
+            order = await self.exchange.create_order(
+                symbol=symbol,
+                side=side,
+                order_type=order_type,
+                quantity=amount,
+                futures=True,
+                extra_params=params
+            )
+            self._invalidate_positions_cache()
+            
+            return {
+                'id': order['orderId'],
+                'symbol': symbol,
+                'side': side.lower(),
+                'type': order_type.lower(),
+                'amount': amount,
+                'stop_price': trigger_price,
+                'status': order['status'].lower(),
+                'timestamp': order.get('updateTime', int(time.time() * 1000)),
+                'futures': True
+            }
+            
+        except Exception as e:
+            self.error_handler.handle_exception(e, f"placing {order_type} order for {symbol}")
+            return None
+    
     async def cancel_order(self, order_id: str, symbol: str, futures: bool = False) -> bool:
         """Cancel order"""
         try:
-            self.exchange.cancel_order(symbol, int(order_id), futures=futures)
+            await self.exchange.cancel_order(symbol, int(order_id), futures=futures)
+            self._invalidate_positions_cache()
             return True
         except Exception as e:
             self.error_handler.handle_exception(e, f"cancelling order {order_id}")
@@ -192,12 +442,22 @@ class ExchangeConnectorHTTP:
     
     async def cancel_all_orders(self, symbol: str = None) -> int:
         """Cancel all orders"""
+        exchange = self.exchange
         try:
-            # Cancel futures orders
-            futures_count = self.exchange.cancel_all_orders(symbol, futures=True)
+            # Futures and spot are independent round trips - cancel both at once
+            futures_count, spot_count = await asyncio.gather(
+                exchange.cancel_all_orders(symbol, futures=True),
+                exchange.cancel_all_orders(symbol, futures=False),
+                return_exceptions=True
+            )
+            self._invalidate_positions_cache()
             
-            # Cancel spot orders
-            spot_count = self.exchange.cancel_all_orders(symbol, futures=False)
+            if isinstance(futures_count, Exception):
+                self.error_handler.handle_exception(futures_count, "cancelling futures orders")
+                futures_count = 0
+            if isinstance(spot_count, Exception):
+                self.error_handler.handle_exception(spot_count, "cancelling spot orders")
+                spot_count = 0
             
             total_count = futures_count + spot_count
             print(f"✅ Cancelled {total_count} orders ({futures_count} futures, {spot_count} spot)")
@@ -207,59 +467,74 @@ class ExchangeConnectorHTTP:
             self.error_handler.handle_exception(e, "cancelling all orders")
             return 0
     
-    async def get_open_orders(self, symbol: str = None) -> List[Dict]:
+    async def get_open_orders(self, symbol: str = None) -> List[Order]:
         """Get open orders"""
+        exchange = self.exchange
         try:
-            orders = []
-            
-            # Get futures orders
-            futures_orders = self.exchange.get_open_orders(symbol, futures=True)
-            for order in futures_orders:
-                order['futures'] = True
-                orders.append(order)
+            # Fetch futures and spot orders concurrently; one failing side doesn't hide the other
+            futures_orders, spot_orders = await asyncio.gather(
+                exchange.get_open_orders(symbol, futures=True),
+                exchange.get_open_orders(symbol, futures=False),
+                return_exceptions=True
+            )
             
-            # Get spot orders
-            spot_orders = self.exchange.get_open_orders(symbol, futures=False)
-            for order in spot_orders:
-                order['futures'] = False
-                orders.append(order)
+            if isinstance(futures_orders, Exception):
+                self.error_handler.handle_exception(futures_orders, "getting futures open orders")
+                futures_orders = []
+            if isinstance(spot_orders, Exception):
+                self.error_handler.handle_exception(spot_orders, "getting spot open orders")
+                spot_orders = []
             
-            return orders
+            return futures_orders + spot_orders
             
         except Exception as e:
             self.error_handler.handle_exception(e, "getting open orders")
             return []
     
     async def get_positions(self) -> List[Dict]:
-        """Get current positions"""
-        try:
-            positions = self.exchange.get_futures_positions()
-            
-            # Cache positions
-            self._positions_cache = {pos['symbol']: pos for pos in positions}
-            self._last_cache_update = time.time()
-            
-            return positions
-            
-        except Exception as e:
-            self.error_handler.handle_exception(e, "getting positions")
-            return []
+        """Get current positions - fetch errors propagate and leave the cache untouched"""
+        positions = await self.exchange.get_futures_positions()
+        
+        # Cache positions
+        self._positions_cache = {pos['symbol']: pos for pos in positions}
+        self._last_cache_update = time.time()
+        
+        return positions
+    
+    async def get_open_positions(self) -> Dict[str, Dict]:
+        """Get open positions keyed by symbol, refetched at most once per POSITIONS_TTL - raises if the fetch fails"""
+        if time.time() - self._last_cache_update < POSITIONS_TTL:
+            return dict(self._positions_cache)
+        
+        async with self._lock:
+            # Another caller may have refreshed while we waited for the lock
+            if time.time() - self._last_cache_update >= POSITIONS_TTL:
+                await self.get_positions()
+            return dict(self._positions_cache)
+    
+    def _invalidate_positions_cache(self) -> None:
+        """Force the next positions read to hit the exchange after orders change"""
+        self._last_cache_update = 0
     
     async def get_position(self, symbol: str) -> Optional[Dict]:
         """Get position for specific symbol"""
         try:
             # Check cache first
-            if (symbol in self._positions_cache and 
-                time.time() - self._last_cache_update < 30):  # 30 second cache
-                return self._positions_cache[symbol]
+            cache = self._positions_cache
+            previous = cache.get(symbol)
+            if previous is not None and time.time() - self._last_cache_update < POSITIONS_TTL:
+                return previous
             
-            # Refresh positions
-            positions = await self.get_positions()
-            for pos in positions:
-                if pos['symbol'] == symbol:
-                    return pos
+            # Refresh just this symbol - single-symbol positionRisk is far lighter than the full dump
+            fetched = await self.exchange.get_futures_positions(symbol)
+            position = fetched[0] if fetched else None
             
-            return None
+            if position is None:
+                cache.pop(symbol, None)
+            else:
+                cache[symbol] = position
+            
+            return position
             
         except Exception as e:
             self.error_handler.handle_exception(e, f"getting position for {symbol}")
@@ -299,29 +574,25 @@ class ExchangeConnectorHTTP:
     
     def format_symbol(self, symbol: str, futures: bool = False) -> str:
         """Format symbol for exchange"""
-        # Remove common suffixes and standardize
-        symbol = symbol.upper().replace("/", "").replace("-", "").replace("_", "")
-        
-        # Add USDT if not present
-        if not symbol.endswith("USDT"):
-            symbol += "USDT"
-        
-        return symbol
+        return format_symbol(symbol)
     
     def normalize_symbol(self, symbol: str, is_futures: bool = True) -> str:
         """Convert symbol from BTCUSDT format to HTTP exchange format"""
+        key = (symbol, is_futures)
+        cached = self._normalize_cache.get(key)
+        if cached is not None:
+            return cached
+        
         try:
             # For HTTP implementation, we keep it simple - just format the symbol
             formatted = self.format_symbol(symbol, is_futures)
             
             # Validate the symbol isn't malformed
-            if formatted.endswith('USDT'):
-                base = formatted[:-4]
-                # Check if base currency is valid (at least 2 chars and not a suffix fragment)
-                if len(base) < 2 or base in ['TU', 'US', 'DT']:
-                    self.error_handler.log_warning(f"Invalid base currency '{base}' from symbol '{symbol}', using original")
-                    return symbol
+            if not has_valid_base(formatted):
+                self.error_handler.log_warning(f"Invalid base currency '{formatted[:-4]}' from symbol '{symbol}', using original")
+                formatted = symbol
             
+            self._normalize_cache[key] = formatted
             return formatted
             
         except Exception as e:
@@ -331,24 +602,50 @@ class ExchangeConnectorHTTP:
     def calculate_quantity(self, symbol: str, price: float, position_size: float, 
                           leverage: int = 1) -> float:
         """Calculate quantity based on position size and leverage"""
+        # Same step flooring as order sizing, applied to the leveraged notional
+        return self.calculate_position_size(symbol, price, position_size * leverage)
+    
+    def calculate_position_size(self, symbol: str, price: float, usd_amount: float,
+                                is_futures: bool = True) -> float:
+        """Calculate order size for a USD amount, floored to the symbol's step size"""
         try:
-            # Calculate base quantity
-            notional = position_size * leverage
-            quantity = notional / price
-            
-            # Round down to avoid precision issues
-            # This is a simplified rounding - in production you'd get symbol info
-            if quantity >= 1:
-                quantity = float(Decimal(str(quantity)).quantize(Decimal('0.001'), rounding=ROUND_DOWN))
-            else:
-                quantity = float(Decimal(str(quantity)).quantize(Decimal('0.00001'), rounding=ROUND_DOWN))
-            
-            return quantity
+            quantity = usd_amount / price
+            step, decimals = self._get_step(symbol) or self._default_step(quantity)
+            return floor_to_step(quantity, step, decimals)
             
         except Exception as e:
-            self.error_handler.handle_exception(e, f"calculating quantity for {symbol}")
+            self.error_handler.handle_exception(e, f"calculating position size for {symbol}")
             return 0.0
     
+    def _get_step(self, symbol: str) -> Optional[Tuple[float, int]]:
+        """Get cached (stepSize, decimals) for a symbol from preloaded exchange info"""
+        return self._get_increment(symbol, 'step_size', self._step_cache)
+    
+    def _get_tick(self, symbol: str) -> Optional[Tuple[float, int]]:
+        """Get cached (tickSize, decimals) for a symbol from preloaded exchange info"""
+        return self._get_increment(symbol, 'tick_size', self._tick_cache)
+    
+    def _get_increment(self, symbol: str, field: str,
+                       cache: Dict[str, Tuple[float, int]]) -> Optional[Tuple[float, int]]:
+        """Look up one exchangeInfo increment with its decimals, remembering the result"""
+        increment = cache.get(symbol)
+        if increment is not None:
+            return increment
+        
+        key = self._canonical_market_key(symbol)
+        limits = self._exchange_info_cache.get(key) if key else None
+        if not limits or limits[field] <= 0:
+            return None
+        
+        increment = cache[symbol] = (limits[field], step_decimals(limits[field]))
+        return increment
+    
+    @staticmethod
+    def _default_step(quantity: float) -> Tuple[float, int]:
+        """Fallback (step, decimals) when the symbol has no LOT_SIZE filter"""
+        step = default_step(quantity)
+        return step, step_decimals(step)
+    
     async def get_positions_summary(self) -> str:
         """Get formatted positions summary"""
         try:
@@ -357,11 +654,19 @@ class ExchangeConnectorHTTP:
             if not positions:
                 return "No active positions"
             
+            # Every displayed field; identical values render an identical summary
+            signature = tuple(
+                (pos['symbol'], pos['side'], pos['size'], pos['entry_price'],
+                 pos['mark_price'], pos['pnl'], pos['percentage'])
+                for pos in positions
+            )
+            if signature == self._summary_signature:
+                return self._summary_text
+            
             summary_lines = []
-            total_pnl = 0.0
+            total_pnl = sum(pos['pnl'] for pos in positions)
             
             for pos in positions:
-                total_pnl += pos['pnl']
                 pnl_emoji = "🟢" if pos['pnl'] >= 0 else "🔴"
                 
                 summary_lines.append(
@@ -375,6 +680,8 @@ class ExchangeConnectorHTTP:
             total_emoji = "🟢" if total_pnl >= 0 else "🔴"
             summary = f"{total_emoji} **Total PnL: {total_pnl:+.2f} USDT**\n\n" + "\n\n".join(summary_lines)
             
+            self._summary_signature = signature
+            self._summary_text = summary
             return summary
             
         except Exception as e:
@@ -3,14 +3,64 @@ Lightweight Exchange HTTP Client - Termux compatible replacement for ccxt
 Uses only requests and built-in libraries to interact with exchange APIs
 """
 
+import asyncio
 import json
 import time
 import hmac
 import hashlib
+import threading
 import urllib.parse
-from typing import Dict, List, Optional, Any
+from collections import Counter
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, List, Optional, Any, Union
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from datetime import datetime
+import fast_json
+from fast_path import format_quantity
+
+
+# Binance error code for "Timestamp for this request is outside of the recvWindow"
+TIMESTAMP_OUTSIDE_RECV_WINDOW = -1021
+
+# Connection pool sized for concurrent to_thread calls; keeps TLS sessions alive between polls
+HTTP_POOL_CONNECTIONS = 20
+HTTP_POOL_MAXSIZE = 50
+
+# Transient failures retried by urllib3; POST is never retried so orders can't be duplicated
+HTTP_RETRY = Retry(
+    total=3,
+    backoff_factor=0.2,
+    status_forcelist=(429, 500, 502, 503, 504),
+    allowed_methods=frozenset({'GET', 'DELETE'}),
+    raise_on_status=False
+)
+
+# Max symbols cleared in parallel by cancel_all_orders, well inside the request weight limit
+CANCEL_CONCURRENCY = 10
+
+# Order types that carry a limit price and timeInForce
+LIMIT_ORDER_TYPES = frozenset({'LIMIT', 'STOP_LOSS_LIMIT', 'TAKE_PROFIT_LIMIT'})
+
+# Milliseconds a signed request stays valid after its timestamp
+RECV_WINDOW = 5000
+
+# Methods _make_request knows how to send
+HTTP_METHODS = frozenset({'GET', 'POST', 'DELETE'})
+
+# Size of each thread's reusable response buffer; a larger body gets a one-off buffer that is dropped after use
+RECV_BUFFER_SIZE = 64 * 1024
+
+# Bytes pulled from the socket per read when streaming a response body
+RECV_CHUNK_SIZE = 64 * 1024
+
+
+@lru_cache(maxsize=256)
+def _order_prefix(symbol: str, side: str, order_type: str) -> str:
+    """Encoded symbol/side/type prefix shared by every order with the same combination"""
+    return f"symbol={symbol}&side={side.upper()}&type={order_type.upper()}"
 
 
 class ExchangeError(Exception):
@@ -18,6 +68,28 @@ class ExchangeError(Exception):
     pass
 
 
+@dataclass
+class Order:
+    """Open order as returned by get_open_orders"""
+    __slots__ = ('id', 'symbol', 'side', 'type', 'quantity', 'filled', 'remaining',
+                 'price', 'status', 'timestamp', 'futures')
+    id: int
+    symbol: str
+    side: str
+    type: str
+    quantity: float
+    filled: float
+    remaining: float
+    price: Optional[float]
+    status: str
+    timestamp: int
+    futures: bool
+    
+    def as_dict(self) -> Dict[str, Any]:
+        """Plain dict view for callers that serialize orders"""
+        return {name: getattr(self, name) for name in self.__slots__}
+
+
 class BinanceHTTPClient:
     """Pure HTTP Binance client compatible with Termux"""
     
@@ -25,6 +97,12 @@ class BinanceHTTPClient:
         self.api_key = api_key
         self.api_secret = api_secret
         self.testnet = testnet
+        self._time_offset = 0  # server time - local time, in ms
+        # (server ms, monotonic ns) anchor; timestamps advance on the monotonic clock from here
+        self._clock_anchor = (int(time.time() * 1000), time.monotonic_ns())
+        self._hmac_proto = hmac.new(api_secret.encode('utf-8'), digestmod=hashlib.sha256)
+        # Per-thread receive buffers - requests run concurrently on to_thread workers
+        self._recv_local = threading.local()
         
         if testnet:
             self.base_url = "https://testnet.binance.vision/api"
@@ -36,23 +114,85 @@ class BinanceHTTPClient:
         self.session = requests.Session()
         self.session.headers.update({
             'X-MBX-APIKEY': api_key,
-            'Content-Type': 'application/x-www-form-urlencoded'
+            'Content-Type': 'application/x-www-form-urlencoded',
+            'Connection': 'keep-alive'
         })
+        adapter = HTTPAdapter(
+            pool_connections=HTTP_POOL_CONNECTIONS,
+            pool_maxsize=HTTP_POOL_MAXSIZE,
+            max_retries=HTTP_RETRY
+        )
+        self.session.mount('https://', adapter)
     
-    def _generate_signature(self, query_string: str) -> str:
+    def close(self) -> None:
+        """Close pooled HTTP connections"""
+        self.session.close()
+    
+    def _generate_signature(self, query: bytes) -> str:
         """Generate HMAC SHA256 signature"""
-        return hmac.new(
-            self.api_secret.encode('utf-8'),
-            query_string.encode('utf-8'),
-            hashlib.sha256
-        ).hexdigest()
+        # Copying the keyed prototype skips re-encoding the secret and re-deriving the key pads
+        signer = self._hmac_proto.copy()
+        signer.update(query)
+        return signer.hexdigest()
     
     def _get_timestamp(self) -> int:
-        """Get current timestamp in milliseconds"""
-        return int(time.time() * 1000)
+        """Get current timestamp in milliseconds, corrected to server time"""
+        server_ms, mono_ns = self._clock_anchor
+        return server_ms + (time.monotonic_ns() - mono_ns) // 1_000_000
+    
+    def sync_time(self) -> int:
+        """Sync signed-request timestamps with the exchange server clock"""
+        local_before = int(time.time() * 1000)
+        mono_before = time.monotonic_ns()
+        server_time = self._make_request('GET', '/v3/time')['serverTime']
+        mono_after = time.monotonic_ns()
+        local_after = int(time.time() * 1000)
+        
+        # Assume the server stamped the response halfway through the round trip
+        self._clock_anchor = (server_time, (mono_before + mono_after) // 2)
+        self._time_offset = server_time - (local_before + local_after) // 2
+        return self._time_offset
+    
+    @staticmethod
+    def _error_code(response: requests.Response) -> Optional[int]:
+        """Extract Binance error code from an error response"""
+        try:
+            return fast_json.loads(response.content).get('code')
+        except (ValueError, AttributeError):
+            return None
+    
+    def _read_json(self, response: requests.Response) -> Any:
+        """Decode a streamed JSON body through this thread's reusable buffer"""
+        if fast_json.orjson is None:
+            # stdlib json copies a buffer back to bytes anyway, so there's nothing to reuse
+            return fast_json.loads(response.content)
+        
+        buf = getattr(self._recv_local, 'buf', None)
+        if buf is None:
+            buf = self._recv_local.buf = bytearray(RECV_BUFFER_SIZE)
+        
+        # Content-Length is only a size hint - gzip bodies decode larger than it
+        content_length = int(response.headers.get('Content-Length') or 0)
+        if content_length > len(buf):
+            buf.extend(bytes(content_length - len(buf)))
+        
+        size = 0
+        for chunk in response.raw.stream(RECV_CHUNK_SIZE, decode_content=True):
+            end = size + len(chunk)
+            buf[size:end] = chunk  # overwrites in place, grows only past the current capacity
+            size = end
+        
+        with memoryview(buf) as view, view[:size] as body:
+            data = fast_json.loads(body)
+        
+        # Don't let one large body (exchangeInfo) pin its size in every worker thread
+        if len(buf) > RECV_BUFFER_SIZE:
+            self._recv_local.buf = None
+        return data
     
-    def _make_request(self, method: str, endpoint: str, params: Dict = None, signed: bool = False, futures: bool = False) -> Dict:
-        """Make HTTP request to exchange"""
+    def _make_request(self, method: str, endpoint: str, params: Union[Dict, str] = None,
+                      signed: bool = False, futures: bool = False, _resynced: bool = False) -> Dict:
+        """Make HTTP request to exchange (params may be a dict or an already-encoded query string)"""
         try:
             base_url = self.futures_url if futures else self.base_url
             url = f"{base_url}{endpoint}"
@@ -61,22 +201,36 @@ class BinanceHTTPClient:
                 params = {}
             
             if signed:
-                params['timestamp'] = self._get_timestamp()
-                query_string = urllib.parse.urlencode(params)
-                params['signature'] = self._generate_signature(query_string)
+                unsigned_params = params
+                query_string = params if isinstance(params, str) else urllib.parse.urlencode(params)
+                if query_string:
+                    query_string += '&'
+                query_string += f"recvWindow={RECV_WINDOW}&timestamp={self._get_timestamp()}"
+                # Encode once (Binance params are ASCII) and send exactly the bytes that were signed
+                query = query_string.encode('ascii')
+                params = query + b'&signature=' + self._generate_signature(query).encode('ascii')
             
-            if method == 'GET':
-                response = self.session.get(url, params=params)
-            elif method == 'POST':
-                response = self.session.post(url, data=params)
-            elif method == 'DELETE':
-                response = self.session.delete(url, params=params)
-            else:
+            if method not in HTTP_METHODS:
                 raise ExchangeError(f"Unsupported HTTP method: {method}")
             
-            if response.status_code == 200:
-                return response.json()
-            else:
+            # POST sends params form-encoded in the body, everything else in the query string
+            in_body = method == 'POST'
+            # Streamed so successful bodies land in the reusable buffer; closing returns the connection
+            with self.session.request(
+                method, url,
+                params=None if in_body else params,
+                data=params if in_body else None,
+                stream=True
+            ) as response:
+                if response.status_code == 200:
+                    return self._read_json(response)
+                
+                if signed and not _resynced and self._error_code(response) == TIMESTAMP_OUTSIDE_RECV_WINDOW:
+                    # Clock drifted between scheduled syncs - resync and retry once
+                    self.sync_time()
+                    return self._make_request(method, endpoint, unsigned_params, signed, futures,
+                                              _resynced=True)
+                
                 error_msg = f"HTTP {response.status_code}: {response.text}"
                 raise ExchangeError(error_msg)
                 
@@ -88,7 +242,7 @@ class BinanceHTTPClient:
     def test_connectivity(self) -> bool:
         """Test exchange connectivity"""
         try:
-            # Test spot connectivity
+            # Test spot connectivity (also opens the pooled TLS connection before signed requests)
             self._make_request('GET', '/v3/ping')
             
             # Test futures connectivity if available
@@ -133,29 +287,31 @@ class BinanceHTTPClient:
         
         return balances
     
-    def get_futures_positions(self) -> List[Dict]:
-        """Get futures positions"""
-        try:
-            positions = self._make_request('GET', '/v2/positionRisk', signed=True, futures=True)
-            active_positions = []
-            
-            for pos in positions:
-                size = float(pos['positionAmt'])
-                if abs(size) > 0:  # Only active positions
-                    active_positions.append({
-                        'symbol': pos['symbol'],
-                        'size': size,
-                        'side': 'long' if size > 0 else 'short',
-                        'entry_price': float(pos['entryPrice']),
-                        'mark_price': float(pos['markPrice']),
-                        'pnl': float(pos['unRealizedProfit']),
-                        'percentage': float(pos['percentage']) if pos['percentage'] else 0
-                    })
-            
-            return active_positions
-        except Exception as e:
-            print(f"❌ Error getting futures positions: {e}")
-            return []
+    def get_futures_positions(self, symbol: str = None) -> List[Dict]:
+        """Get futures positions, optionally for a single symbol"""
+        # Errors propagate - an empty list must only ever mean "no open positions"
+        params = {'symbol': symbol} if symbol else None
+        positions = self._make_request('GET', '/v2/positionRisk', params, signed=True, futures=True)
+        active_positions = []
+        append = active_positions.append
+        
+        # positionRisk lists every symbol; only parse the remaining fields for open ones
+        for pos in positions:
+            size = float(pos['positionAmt'])
+            if not size:
+                continue
+            append({
+                'symbol': pos['symbol'],
+                'size': size,
+                'side': 'long' if size > 0 else 'short',
+                'entry_price': float(pos['entryPrice']),
+                'mark_price': float(pos['markPrice']),
+                'pnl': float(pos['unRealizedProfit']),
+                'percentage': float(pos.get('percentage') or 0),
+                'update_time': int(pos.get('updateTime', 0))
+            })
+        
+        return active_positions
     
     def get_ticker(self, symbol: str) -> Dict:
         """Get ticker price for symbol"""
@@ -167,21 +323,20 @@ class BinanceHTTPClient:
         }
     
     def create_order(self, symbol: str, side: str, order_type: str, quantity: float,
-                    price: float = None, time_in_force: str = 'GTC', futures: bool = False) -> Dict:
+                    price: float = None, time_in_force: str = 'GTC', futures: bool = False,
+                    extra_params: Dict = None) -> Dict:
         """Create order"""
-        params = {
-            'symbol': symbol,
-            'side': side.upper(),
-            'type': order_type.upper(),
-            'quantity': str(quantity)
-        }
+        # Symbols, sides, types and numbers never need escaping, so skip urlencode for them
+        query = f"{_order_prefix(symbol, side, order_type)}&quantity={format_quantity(quantity)}"
         
-        if price and order_type.upper() in ['LIMIT', 'STOP_LOSS_LIMIT', 'TAKE_PROFIT_LIMIT']:
-            params['price'] = str(price)
-            params['timeInForce'] = time_in_force
+        if price and order_type.upper() in LIMIT_ORDER_TYPES:
+            query += f"&price={price}&timeInForce={time_in_force}"
+        
+        if extra_params:
+            query += '&' + urllib.parse.urlencode(extra_params)
         
         endpoint = '/v1/order' if futures else '/v3/order'
-        return self._make_request('POST', endpoint, params, signed=True, futures=futures)
+        return self._make_request('POST', endpoint, query, signed=True, futures=futures)
     
     def cancel_order(self, symbol: str, order_id: int = None, orig_client_order_id: str = None, futures: bool = False) -> Dict:
         """Cancel order"""
@@ -197,7 +352,7 @@ class BinanceHTTPClient:
         endpoint = '/v1/order' if futures else '/v3/order'
         return self._make_request('DELETE', endpoint, params, signed=True, futures=futures)
     
-    def get_open_orders(self, symbol: str = None, futures: bool = False) -> List[Dict]:
+    def get_open_orders(self, symbol: str = None, futures: bool = False) -> List[Order]:
         """Get open orders"""
         params = {}
         if symbol:
@@ -207,44 +362,33 @@ class BinanceHTTPClient:
         orders = self._make_request('GET', endpoint, params, signed=True, futures=futures)
         
         processed_orders = []
+        append = processed_orders.append
         for order in orders:
-            processed_orders.append({
-                'id': order['orderId'],
-                'symbol': order['symbol'],
-                'side': order['side'].lower(),
-                'type': order['type'].lower(),
-                'quantity': float(order['origQty']),
-                'filled': float(order['executedQty']),
-                'remaining': float(order['origQty']) - float(order['executedQty']),
-                'price': float(order['price']) if order['price'] != '0.00000000' else None,
-                'status': order['status'].lower(),
-                'timestamp': order['time']
-            })
+            quantity = float(order['origQty'])
+            filled = float(order['executedQty'])
+            append(Order(
+                order['orderId'],
+                order['symbol'],
+                order['side'].lower(),
+                order['type'].lower(),
+                quantity,
+                filled,
+                quantity - filled,
+                float(order['price']) or None,  # market orders report a zero price
+                order['status'].lower(),
+                order['time'],
+                futures
+            ))
         
         return processed_orders
     
-    def cancel_all_orders(self, symbol: str = None, futures: bool = False) -> int:
-        """Cancel all open orders"""
+    def cancel_all_orders(self, symbol: str, futures: bool = False) -> int:
+        """Cancel all open orders for one symbol"""
+        # Orders across symbols are fanned out per symbol by ExchangeClient.cancel_all_orders
         try:
-            if symbol:
-                # Cancel orders for specific symbol
-                params = {'symbol': symbol}
-                endpoint = '/v1/allOpenOrders' if futures else '/v3/openOrders'
-                result = self._make_request('DELETE', endpoint, params, signed=True, futures=futures)
-                return len(result) if isinstance(result, list) else 1
-            else:
-                # Get all open orders and cancel them individually
-                open_orders = self.get_open_orders(futures=futures)
-                cancelled_count = 0
-                
-                for order in open_orders:
-                    try:
-                        self.cancel_order(order['symbol'], order['id'], futures=futures)
-                        cancelled_count += 1
-                    except Exception as e:
-                        print(f"❌ Failed to cancel order {order['id']}: {e}")
-                
-                return cancelled_count
+            endpoint = '/v1/allOpenOrders' if futures else '/v3/openOrders'
+            result = self._make_request('DELETE', endpoint, {'symbol': symbol}, signed=True, futures=futures)
+            return len(result) if isinstance(result, list) else 1
         except Exception as e:
             print(f"❌ Error cancelling orders: {e}")
             return 0
@@ -283,6 +427,88 @@ class ExchangeClient:
         else:
             raise ExchangeError(f"Unsupported exchange: {exchange}")
     
-    def __getattr__(self, name):
-        """Delegate method calls to the underlying client"""
-        return getattr(self.client, name)
\ No newline at end of file
+    # Each call runs the blocking HTTP client in a worker thread so the event loop keeps running
+    
+    def close(self) -> None:
+        """Close pooled HTTP connections"""
+        self.client.close()
+    
+    async def test_connectivity(self) -> bool:
+        """Test exchange connectivity"""
+        return await asyncio.to_thread(self.client.test_connectivity)
+    
+    async def sync_time(self) -> int:
+        """Sync signed-request timestamps with the exchange server clock"""
+        return await asyncio.to_thread(self.client.sync_time)
+    
+    async def get_account_info(self) -> Dict:
+        """Get account information"""
+        return await asyncio.to_thread(self.client.get_account_info)
+    
+    async def get_futures_account(self) -> Dict:
+        """Get futures account information"""
+        return await asyncio.to_thread(self.client.get_futures_account)
+    
+    async def get_balance(self, symbol: str = None) -> Dict:
+        """Get account balance"""
+        return await asyncio.to_thread(self.client.get_balance, symbol)
+    
+    async def get_futures_positions(self, symbol: str = None) -> List[Dict]:
+        """Get futures positions, optionally for a single symbol"""
+        return await asyncio.to_thread(self.client.get_futures_positions, symbol)
+    
+    async def get_ticker(self, symbol: str) -> Dict:
+        """Get ticker price for symbol"""
+        return await asyncio.to_thread(self.client.get_ticker, symbol)
+    
+    async def create_order(self, symbol: str, side: str, order_type: str, quantity: float,
+                           price: float = None, time_in_force: str = 'GTC', futures: bool = False,
+                           extra_params: Dict = None) -> Dict:
+        """Create order"""
+        return await asyncio.to_thread(self.client.create_order, symbol, side, order_type, quantity,
+                                       price, time_in_force, futures, extra_params)
+    
+    async def cancel_order(self, symbol: str, order_id: int = None, orig_client_order_id: str = None,
+                           futures: bool = False) -> Dict:
+        """Cancel order"""
+        return await asyncio.to_thread(self.client.cancel_order, symbol, order_id,
+                                       orig_client_order_id, futures)
+    
+    async def get_open_orders(self, symbol: str = None, futures: bool = False) -> List[Order]:
+        """Get open orders"""
+        return await asyncio.to_thread(self.client.get_open_orders, symbol, futures)
+    
+    async def cancel_all_orders(self, symbol: str = None, futures: bool = False) -> int:
+        """Cancel all open orders, clearing every symbol concurrently when none is given"""
+        if symbol:
+            return await asyncio.to_thread(self.client.cancel_all_orders, symbol, futures)
+        
+        open_orders = await self.get_open_orders(futures=futures)
+        orders_per_symbol = Counter(order.symbol for order in open_orders)
+        if not orders_per_symbol:
+            return 0
+        
+        semaphore = asyncio.Semaphore(CANCEL_CONCURRENCY)
+        
+        async def cancel_symbol(order_symbol: str) -> int:
+            async with semaphore:
+                return await asyncio.to_thread(self.client.cancel_all_orders, order_symbol, futures)
+        
+        symbols = list(orders_per_symbol)
+        results = await asyncio.gather(*(cancel_symbol(s) for s in symbols), return_exceptions=True)
+        
+        # The per-symbol bulk DELETE logs and returns 0 on failure
+        return sum(orders_per_symbol[s] for s, result in zip(symbols, results)
+                   if not isinstance(result, Exception) and result)
+    
+    async def set_leverage(self, symbol: str, leverage: int) -> Dict:
+        """Set leverage for futures symbol"""
+        return await asyncio.to_thread(self.client.set_leverage, symbol, leverage)
+    
+    async def get_exchange_info(self, futures: bool = False) -> Dict:
+        """Get exchange information"""
+        return await asyncio.to_thread(self.client.get_exchange_info, futures)
+    
+    async def get_klines(self, symbol: str, interval: str = '1h', limit: int = 100) -> List[List]:
+        """Get kline/candlestick data"""
+        return await asyncio.to_thread(self.client.get_klines, symbol, interval, limit)
\ No newline at end of file
@@ -0,0 +1,40 @@
+"""
+Fast JSON - orjson-backed JSON helpers with a stdlib fallback compatible with Termux
+Uses orjson when a wheel is available, otherwise the built-in json module
+"""
+
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:
+    # orjson needs a prebuilt wheel; fall back to stdlib json
+    orjson = None
+
+
+def loads(data: Union[str, bytes, bytearray, memoryview]) -> Any:
+    """Decode JSON from str, bytes or a buffer"""
+    if orjson is not None:
+        return orjson.loads(data)
+    if isinstance(data, memoryview):
+        # stdlib json only takes str/bytes/bytearray
+        data = data.tobytes()
+    return json.loads(data)
+
+
+def dumps(obj: Any, indent: bool = False) -> str:
+    """Encode JSON to str, optionally pretty-printed with two-space indent"""
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, option=option).decode()
+    return json.dumps(obj, indent=2 if indent else None)
+
+
+def dumps_bytes(obj: Any) -> bytes:
+    """Encode JSON straight to UTF-8 bytes, e.g. for an HTTP request body"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj).encode('utf-8')
@@ -0,0 +1,152 @@
+"""
+Fast Path - Typed pure helpers for per-order symbol, size and price math
+Plain Python by default; fully annotated so `mypyc fast_path.py` can compile it in place
+"""
+
+import math
+import re
+import sys
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Tuple
+
+
+# Base fragments left over when a suffix is stripped twice (e.g. "USDTUSDT")
+INVALID_BASES = frozenset({'TU', 'US', 'DT', 'SDT', 'TUT', 'UST'})
+
+# Quote currency every traded symbol ends in
+QUOTE_SUFFIX = sys.intern('USDT')
+
+# Separators users put between base and quote ("BTC/USDT", "BTC-USDT", "BTC_USDT")
+_SYMBOL_SEPARATORS = re.compile(r'[/_\-]')
+
+# Closest a stop loss or take profit may sit to entry, as a fraction of entry (0.1%)
+MIN_LEVEL_DISTANCE = 0.001
+
+# Leverage range Binance futures accepts
+MIN_LEVERAGE = 1
+MAX_LEVERAGE = 125
+
+# Finest stepSize precision Binance publishes (8 decimals) with headroom
+MAX_STEP_DECIMALS = 12
+
+# Slack added before flooring so float error (0.29 * 100 = 28.999...) can't drop a whole step
+STEP_FLOOR_EPSILON = 1e-6
+
+
+def _parse_lot_size(f: Dict[str, Any], limits: Dict[str, float]) -> None:
+    limits['min_qty'] = float(f['minQty'])
+    limits['max_qty'] = float(f['maxQty'])
+    limits['step_size'] = float(f['stepSize'])
+
+
+def _parse_price_filter(f: Dict[str, Any], limits: Dict[str, float]) -> None:
+    limits['tick_size'] = float(f['tickSize'])
+
+
+def _parse_min_notional(f: Dict[str, Any], limits: Dict[str, float]) -> None:
+    # Futures report "notional", older spot filters report "minNotional"
+    limits['min_notional'] = float(f.get('notional', f.get('minNotional', 0)))
+
+
+def _parse_notional(f: Dict[str, Any], limits: Dict[str, float]) -> None:
+    limits['min_notional'] = float(f.get('minNotional', 0))
+
+
+# exchangeInfo filterType -> parser writing into the symbol's limits dict
+_FILTER_PARSERS: Dict[str, Callable[[Dict[str, Any], Dict[str, float]], None]] = {
+    'LOT_SIZE': _parse_lot_size,
+    'PRICE_FILTER': _parse_price_filter,
+    'MIN_NOTIONAL': _parse_min_notional,
+    'NOTIONAL': _parse_notional,
+}
+
+
+def parse_symbol_limits(symbol_info: Dict[str, Any]) -> Dict[str, float]:
+    """Build the limits dict for one exchangeInfo symbol entry"""
+    limits = {'min_qty': 0.0, 'max_qty': 0.0, 'step_size': 0.0, 'tick_size': 0.0, 'min_notional': 0.0}
+    filters: List[Dict[str, Any]] = symbol_info.get('filters', [])
+    for f in filters:
+        parser = _FILTER_PARSERS.get(f.get('filterType', ''))
+        if parser is not None:
+            parser(f, limits)
+    return limits
+
+
+def step_decimals(step: float) -> int:
+    """Number of decimal places in a LOT_SIZE step or PRICE_FILTER tick (0.001 -> 3, 1e-8 -> 8)"""
+    text = f"{step:.{MAX_STEP_DECIMALS}f}".rstrip('0')
+    return len(text) - text.index('.') - 1
+
+
+def floor_to_step(quantity: float, step: float, decimals: int) -> float:
+    """Round quantity down to a whole number of steps"""
+    # Count whole steps, then round away the float noise of steps * step so the
+    # result prints as the exchange expects (0.29, not 0.29000000000000004)
+    steps = math.floor(quantity / step + STEP_FLOOR_EPSILON)
+    return round(steps * step, decimals)
+
+
+def round_to_step(value: float, step: float, decimals: int) -> float:
+    """Round a price to the nearest tick; trigger prices have no side to floor toward"""
+    return round(round(value / step) * step, decimals)
+
+
+def format_quantity(quantity: float) -> str:
+    """Plain decimal text for an order parameter; str() would give '5e-05' for small sizes"""
+    text = repr(quantity)
+    if 'e' not in text:
+        return text
+    return f"{quantity:.{MAX_STEP_DECIMALS}f}".rstrip('0').rstrip('.')
+
+
+def default_step(quantity: float) -> float:
+    """Fallback precision when the symbol has no cached LOT_SIZE filter"""
+    return 0.001 if quantity >= 1 else 0.00001
+
+
+@lru_cache(maxsize=1024)
+def format_symbol(symbol: str) -> str:
+    """Strip separators and make sure the symbol is quoted in USDT"""
+    symbol = _SYMBOL_SEPARATORS.sub('', symbol.upper())
+    if not symbol.endswith(QUOTE_SUFFIX):
+        symbol += QUOTE_SUFFIX
+    return sys.intern(symbol)
+
+
+def has_valid_base(formatted: str) -> bool:
+    """Check a formatted USDT symbol doesn't have a truncated base currency"""
+    if not formatted.endswith(QUOTE_SUFFIX):
+        return True
+    base = formatted[:-4]
+    return len(base) >= 2 and base not in INVALID_BASES
+
+
+def check_signal_levels(action: str, entry: float, stop_loss: float, take_profit: float,
+                        leverage: int) -> Tuple[str, float, float]:
+    """Check prices and leverage in one pass; returns (reason or "", sl_distance, tp_distance)"""
+    if entry <= 0 or stop_loss <= 0 or take_profit <= 0:
+        return "Prices must be positive", 0.0, 0.0
+    
+    # Stop loss goes against the trade, take profit with it
+    if action == 'buy':
+        if stop_loss >= entry:
+            return f"Invalid buy signal: SL ({stop_loss}) >= Entry ({entry})", 0.0, 0.0
+        if take_profit <= entry:
+            return f"Invalid buy signal: TP ({take_profit}) <= Entry ({entry})", 0.0, 0.0
+    elif action == 'sell':
+        if stop_loss <= entry:
+            return f"Invalid sell signal: SL ({stop_loss}) <= Entry ({entry})", 0.0, 0.0
+        if take_profit >= entry:
+            return f"Invalid sell signal: TP ({take_profit}) >= Entry ({entry})", 0.0, 0.0
+    
+    if leverage < MIN_LEVERAGE or leverage > MAX_LEVERAGE:
+        return f"Invalid leverage: {leverage}", 0.0, 0.0
+    
+    inv_entry = 1.0 / entry
+    sl_distance = abs(stop_loss - entry) * inv_entry
+    tp_distance = abs(take_profit - entry) * inv_entry
+    if sl_distance < MIN_LEVEL_DISTANCE:
+        return f"Stop loss too close to entry: {sl_distance*100:.3f}%", sl_distance, tp_distance
+    if tp_distance < MIN_LEVEL_DISTANCE:
+        return f"Take profit too close to entry: {tp_distance*100:.3f}%", sl_distance, tp_distance
+    return "", sl_distance, tp_distance
@@ -7,9 +7,15 @@ import asyncio
 import signal
 import sys
 import os
+import time
+from itertools import islice
 from typing import Optional
-from datetime import datetime
 from dotenv import load_dotenv
+try:
+    import uvloop
+except ImportError:
+    # uvloop has no Termux build; the default asyncio loop works the same, just slower
+    uvloop = None
 from config_manager import ConfigManager
 from error_handler import get_error_handler
 from performance_monitor import get_performance_monitor
@@ -17,7 +23,61 @@ from exchange_connector_http import ExchangeConnectorHTTP
 from signal_parser_http import SignalParserHTTP as SignalParser, TradeSignal
 from trade_manager import TradeManager
 from trade_tracker import TradeTracker
-from discord_controller_http import DiscordControllerHTTP
+from discord_controller_http import DiscordControllerHTTP, DiscordMessageBatcher
+
+
+# Notification templates, parsed once at import instead of rebuilding f-strings per signal
+SIGNAL_NOTIFICATION_TEMPLATE = """🎯 **{action} Signal Detected**
+
+📊 **Symbol:** {symbol}
+🎯 **Action:** {action}
+💰 **Entry:** ${entry_price:.4f}
+🛑 **Stop Loss:** ${stop_loss:.4f} ({stop_loss_percentage:.1f}%)
+🎉 **Take Profit:** ${take_profit:.4f} ({take_profit_percentage:.1f}%)
+⚡ **Leverage:** {leverage}x
+📈 **Type:** {trade_type}
+🔍 **Source:** {source}"""
+
+CONFIDENCE_TEMPLATE = "\n🎯 **Confidence:** {confidence_score:.1f}%"
+
+# Bound formatters for the per-signal notification
+_format_signal_text = SIGNAL_NOTIFICATION_TEMPLATE.format
+_format_confidence = CONFIDENCE_TEMPLATE.format
+
+TRADE_EXECUTED_TEMPLATE = (
+    "✅ **Trade Executed**\n\n"
+    "Signal: {symbol} {action}\n"
+    "Status: {message}"
+)
+
+TRADE_FAILED_TEMPLATE = (
+    "❌ **Trade Failed**\n\n"
+    "Signal: {symbol} {action}\n"
+    "Error: {message}"
+)
+
+TRADING_DISABLED_TEMPLATE = (
+    "⚠️ **Trading Disabled**\n\n"
+    "Received signal for {symbol} but trading is disabled.\n"
+    "Use `!start` to enable trading."
+)
+
+# Sent instead of parsing when a signal arrives while trading is paused
+SIGNAL_IGNORED_TEMPLATE = "⚠️ Trading disabled, ignored signal from {source}"
+
+# Pending signals kept before the oldest is dropped to make room for a new one
+SIGNAL_QUEUE_MAXSIZE = 64
+
+# Seconds a queued signal stays actionable
+SIGNAL_MAX_AGE = 300
+
+# Seconds the shutdown notice may take before Discord is closed without it
+SHUTDOWN_NOTIFY_TIMEOUT = 2.0
+
+
+def _now_str() -> str:
+    """Local wall-clock time for notifications, without building a datetime"""
+    return time.strftime('%Y-%m-%d %H:%M:%S', time.localtime())
 
 
 class TradingBotHTTP:
@@ -27,46 +87,56 @@ class TradingBotHTTP:
         self.error_handler = get_error_handler()
         self.performance_monitor = get_performance_monitor()
         self.config_manager: Optional[ConfigManager] = None
+        # Current config snapshot, swapped by the config manager on every reload
+        self._config = None
         self.exchange: Optional[ExchangeConnectorHTTP] = None
         self.signal_parser: Optional[SignalParser] = None
         self.trade_manager: Optional[TradeManager] = None
         self.trade_tracker: Optional[TradeTracker] = None
         self.discord: Optional[DiscordControllerHTTP] = None
+        self._msg_batcher: Optional[DiscordMessageBatcher] = None
+        self._signal_queue: Optional[asyncio.Queue] = None
+        self._queue_task: Optional[asyncio.Task] = None
         
-        self._shutdown_event = asyncio.Event()
+        # Resolved by shutdown(); created in initialize() once the loop is running
+        self._shutdown_future: Optional[asyncio.Future] = None
+        # Shutdown started by SIGINT/SIGTERM; held so the task can't be garbage collected mid-run
+        self._shutdown_task: Optional[asyncio.Task] = None
         self._running = False
         
     async def initialize(self) -> None:
         """Initialize all bot components"""
         try:
             print("ℹ️ 🤖 Initializing Trading Bot...")
+            self._shutdown_future = asyncio.get_running_loop().create_future()
+            self._signal_queue = asyncio.Queue(maxsize=SIGNAL_QUEUE_MAXSIZE)
             
-            # Initialize performance monitor
-            await self.performance_monitor.initialize()
+            # Stage 1: performance monitor and config - everything else needs the config
+            await self._timed("init_performance_monitor", self.performance_monitor.initialize())
             self.error_handler.log_success("Performance Monitor initialized")
             
-            # Initialize config manager
             self.config_manager = ConfigManager()
-            config = self.config_manager.get_config()
+            self.config_manager.subscribe(self._on_config_change)
+            config = self._config = self.config_manager.get_config()
             
-            # Initialize exchange connector
+            # Stage 2: exchange handshake and Discord login don't depend on each other
             self.exchange = ExchangeConnectorHTTP(config)
-            await self.exchange.initialize()
-            
-            # Initialize signal parser
             self.signal_parser = SignalParser(config)
-            
-            # Initialize trade manager
-            self.trade_manager = TradeManager(config, self.exchange)
-            await self.trade_manager.initialize()
-            
-            # Initialize trade tracker
-            self.trade_tracker = TradeTracker(config, self.exchange)
-            await self.trade_tracker.initialize()
-            
-            # Initialize Discord controller
             self.discord = DiscordControllerHTTP(config)
-            await self.discord.initialize()
+            self._msg_batcher = DiscordMessageBatcher(self.discord.send_message)
+            self._msg_batcher.start()
+            await asyncio.gather(
+                self._timed("init_exchange", self.exchange.initialize()),
+                self._timed("init_discord", self.discord.initialize())
+            )
+            
+            # Stage 3: trade manager and tracker both need the connected exchange
+            self.trade_manager = TradeManager(self.exchange, config)
+            self.trade_tracker = TradeTracker(self.exchange, config)
+            await asyncio.gather(
+                self._timed("init_trade_manager", self.trade_manager.initialize()),
+                self._timed("init_trade_tracker", self.trade_tracker.initialize())
+            )
             
             # Set up callbacks
             await self._setup_callbacks()
@@ -77,6 +147,15 @@ class TradingBotHTTP:
             self.error_handler.handle_exception(e, "bot initialization")
             raise
     
+    def _on_config_change(self, config) -> None:
+        """Refresh the config snapshot after the file is reloaded or updated"""
+        self._config = config
+    
+    async def _timed(self, operation: str, coro):
+        """Await a coroutine while recording its duration"""
+        with self.performance_monitor.time_operation(operation):
+            return await coro
+    
     async def _setup_callbacks(self) -> None:
         """Setup callbacks between components"""
         try:
@@ -84,23 +163,62 @@ class TradingBotHTTP:
             self.discord.set_cancel_all_callback(self._handle_cancel_all)
             self.discord.set_get_positions_callback(self._handle_get_positions)
             self.discord.set_get_stats_callback(self._handle_get_stats)
+            self.discord.set_get_dashboard_callback(self._handle_get_dashboard)
             self.discord.set_signal_callback(self._handle_signal)
             self.error_handler.log_success("Callbacks configured")
             
             # Start signal queue processor
-            asyncio.create_task(self._process_signal_queue())
+            self._queue_task = asyncio.create_task(self._process_signal_queue())
             self.error_handler.log_info("Signal queue processor started")
             
-            # Start position monitoring
-            current_positions = await self.exchange.get_positions()
-            for pos in current_positions:
-                if abs(pos['size']) > 0:
-                    print(f"⚠️ Detected untracked position: {pos['symbol']} (ignoring - might be from another bot)")
+            # Report balance and existing positions
+            await self._send_startup_health_status()
             
         except Exception as e:
             self.error_handler.handle_exception(e, "setting up callbacks")
             raise
     
+    async def _send_startup_health_status(self) -> None:
+        """Send startup banner with balance and open positions"""
+        exchange = self.exchange
+        error_handler = self.error_handler
+        # Independent round trips - fetch both at once
+        balance, positions = await asyncio.gather(
+            exchange.get_futures_balance(),
+            exchange.get_open_positions(),
+            return_exceptions=True
+        )
+        
+        if isinstance(balance, Exception):
+            error_handler.handle_exception(balance, "fetching startup balance")
+            balance_text = "Unable to fetch"
+        else:
+            balance_text = f"${balance:.2f} USDT"
+        
+        if isinstance(positions, Exception):
+            error_handler.handle_exception(positions, "fetching startup positions")
+            positions_text = "Unable to fetch"
+        elif not positions:
+            positions_text = "None"
+        else:
+            for symbol in positions:
+                print(f"⚠️ Detected untracked position: {symbol} (ignoring - might be from another bot)")
+            
+            total = len(positions)
+            positions_text = f"{total} open"
+            for symbol, pos in islice(positions.items(), 3):
+                positions_text += f"\n• {symbol} {pos['side'].upper()} {pos['pnl']:+.2f} USDT"
+            if total > 3:
+                positions_text += f"\n• ...and {total - 3} more"
+        
+        if self.discord:
+            await self.discord.send_message(
+                f"🤖 **Trading Bot Online**\n\n"
+                f"🕒 **Started:** {_now_str()}\n"
+                f"💰 **Futures Balance:** {balance_text}\n"
+                f"📈 **Positions:** {positions_text}"
+            )
+    
     async def _handle_cancel_all(self) -> int:
         """Handle cancel all orders request"""
         try:
@@ -129,88 +247,104 @@ class TradingBotHTTP:
             self.error_handler.handle_exception(e, "get stats")
             return {"error": str(e)}
     
+    async def _handle_get_dashboard(self) -> tuple:
+        """Handle combined positions and stats request"""
+        try:
+            if self.trade_tracker:
+                return await self.trade_tracker.get_dashboard()
+            return "Trade tracker not available", {}
+        except Exception as e:
+            self.error_handler.handle_exception(e, "get dashboard")
+            return "❌ Error getting positions", {}
+    
     async def _handle_signal(self, content: str, images: list, source: str) -> None:
         """Handle incoming signal from Discord"""
+        # Hot path - bind the handles used more than once
+        error_handler = self.error_handler
+        discord = self.discord
         try:
-            print(f"📡 Processing signal from {source}")
-            print(f"📄 Content length: {len(content)} chars")
-            print(f"🖼️ Images: {len(images)}")
+            if error_handler.debug_enabled:
+                error_handler.log_debug(
+                    f"📡 Processing signal from {source} ({len(content)} chars, {len(images)} images)"
+                )
+            
+            # Parsing is the expensive step - skip it entirely while trading is paused
+            if not self._config.is_trading_enabled:
+                if self._msg_batcher:
+                    await self._msg_batcher.process(SIGNAL_IGNORED_TEMPLATE.format(source=source))
+                return
             
             # Parse the signal
             signal_data = await self.signal_parser.parse_signal(content, images)
             
             if signal_data:
-                print(f"✅ Signal parsed successfully: {signal_data.symbol} {signal_data.action}")
-                
                 # Send notification to Discord
-                if self.discord:
+                if discord:
                     signal_text = self._format_signal_for_notification(signal_data)
-                    await self.discord.send_signal_notification(signal_text, content)
+                    await discord.send_signal_notification(signal_text, content)
                 
                 # Add to queue for processing
                 await self._add_signal_to_queue(signal_data, source)
             else:
-                print("❌ Failed to parse signal")
+                error_handler.log_warning(f"Failed to parse signal from {source}")
                 
         except Exception as e:
-            self.error_handler.handle_exception(e, f"handling signal from {source}")
+            error_handler.handle_exception(e, f"handling signal from {source}")
     
     def _format_signal_for_notification(self, signal: TradeSignal) -> str:
         """Format signal for Discord notification"""
-        try:
-            signal_text = f"""🎯 **{signal.action.upper()} Signal Detected**
-            
-📊 **Symbol:** {signal.symbol}
-🎯 **Action:** {signal.action.upper()}
-💰 **Entry:** ${signal.entry_price:.4f}
-🛑 **Stop Loss:** ${signal.stop_loss:.4f} ({signal.stop_loss_percentage:.1f}%)
-🎉 **Take Profit:** ${signal.take_profit:.4f} ({signal.take_profit_percentage:.1f}%)
-⚡ **Leverage:** {signal.leverage}x
-📈 **Type:** {signal.trade_type.upper()}
-🔍 **Source:** {signal.source}"""
-            
-            if signal.confidence_score:
-                signal_text += f"\\n🎯 **Confidence:** {signal.confidence_score:.1f}%"
-            
-            return signal_text
-            
-        except Exception as e:
-            self.error_handler.handle_exception(e, "formatting signal notification")
-            return f"Signal: {signal.symbol} {signal.action}"
+        # Parsed signals always carry numeric prices, so a formatting error here is a bug worth surfacing
+        signal_text = _format_signal_text(
+            symbol=signal.symbol,
+            action=signal.action.upper(),
+            entry_price=signal.entry_price,
+            stop_loss=signal.stop_loss,
+            stop_loss_percentage=signal.stop_loss_percentage,
+            take_profit=signal.take_profit,
+            take_profit_percentage=signal.take_profit_percentage,
+            leverage=signal.leverage,
+            trade_type=signal.trade_type.upper(),
+            source=signal.source
+        )
+        if signal.confidence_score:
+            signal_text += _format_confidence(confidence_score=signal.confidence_score)
+        return signal_text
     
     async def _add_signal_to_queue(self, signal: TradeSignal, source: str) -> None:
         """Add signal to processing queue"""
         try:
-            if not hasattr(self, '_signal_queue'):
-                self._signal_queue = asyncio.Queue()
-            
-            await self._signal_queue.put((signal, source, datetime.now()))
-            print(f"📥 Signal added to queue: {signal.symbol}")
+            queue = self._signal_queue
+            item = (signal, source, time.monotonic() + SIGNAL_MAX_AGE)
+            try:
+                queue.put_nowait(item)
+            except asyncio.QueueFull:
+                # Fresh signals beat stale ones - evict the oldest instead of blocking the caller
+                dropped = queue.get_nowait()
+                print(f"⚠️ Signal queue full - dropping oldest signal: {dropped[0].symbol}")
+                queue.put_nowait(item)
+            # One line per received signal covers both receipt and queueing
+            self.error_handler.log_info(f"📥 Signal from {source} queued: {signal.symbol}")
             
         except Exception as e:
             self.error_handler.handle_exception(e, "adding signal to queue")
     
     async def _process_signal_queue(self) -> None:
         """Process signals from the queue"""
-        if not hasattr(self, '_signal_queue'):
-            self._signal_queue = asyncio.Queue()
-        
         print("🔄 Signal queue processor started")
         
-        while self._running:
+        queue = self._signal_queue
+        while True:
             try:
-                # Get signal from queue with timeout
-                try:
-                    signal, source, timestamp = await asyncio.wait_for(
-                        self._signal_queue.get(), timeout=1.0
-                    )
-                except asyncio.TimeoutError:
-                    continue
+                # Sleeps until a signal arrives; shutdown wakes it with a None sentinel
+                item = await queue.get()
+                if item is None:
+                    break
+                signal, source, deadline = item
                 
-                # Check if signal is too old (more than 5 minutes)
-                age = (datetime.now() - timestamp).total_seconds()
-                if age > 300:  # 5 minutes
-                    print(f"⚠️ Discarding old signal: {signal.symbol} (age: {age:.1f}s)")
+                # Drop signals that sat in the queue past SIGNAL_MAX_AGE
+                overdue = time.monotonic() - deadline
+                if overdue > 0:
+                    print(f"⚠️ Discarding old signal: {signal.symbol} (age: {SIGNAL_MAX_AGE + overdue:.1f}s)")
                     continue
                 
                 # Process the signal
@@ -220,47 +354,53 @@ class TradingBotHTTP:
                 self.error_handler.handle_exception(e, "processing signal queue")
                 await asyncio.sleep(1)
     
+    def _stop_signal_queue(self) -> None:
+        """Wake the queue processor with the None sentinel so it exits"""
+        queue = self._signal_queue
+        if queue is None or self._queue_task is None or self._queue_task.done():
+            return
+        if queue.full():
+            # Pending signals are abandoned at shutdown anyway - make room for the sentinel
+            queue.get_nowait()
+        queue.put_nowait(None)
+    
     async def _execute_signal(self, signal: TradeSignal, source: str) -> None:
         """Execute a trading signal"""
+        symbol = signal.symbol
+        # Notifications go through the batcher so a burst of signals shares DMs
+        batcher = self._msg_batcher
         try:
-            config = self.config_manager.get_config()
+            config = self._config
             
             # Check if trading is enabled
             if not config.is_trading_enabled:
-                print(f"⚠️ Trading disabled - ignoring signal: {signal.symbol}")
-                if self.discord:
-                    await self.discord.send_message(
-                        f"⚠️ **Trading Disabled**\\n\\n"
-                        f"Received signal for {signal.symbol} but trading is disabled.\\n"
-                        f"Use `!start` to enable trading."
-                    )
-                return
-            
-            print(f"🎯 Executing signal: {signal.symbol} {signal.action}")
-            
-            # Execute through trade manager
-            if self.trade_manager:
-                result = await self.trade_manager.execute_signal(signal)
+                message = TRADING_DISABLED_TEMPLATE.format(symbol=symbol)
+            else:
+                print(f"🎯 Executing signal: {symbol} {signal.action}")
+                
+                # Execute through trade manager
+                trade_manager = self.trade_manager
+                if not trade_manager:
+                    return
+                result = await trade_manager.execute_signal(signal)
                 
                 if result.get('success'):
-                    print(f"✅ Signal executed successfully: {signal.symbol}")
-                    if self.discord:
-                        await self.discord.send_message(
-                            f"✅ **Trade Executed**\\n\\n"
-                            f"Signal: {signal.symbol} {signal.action.upper()}\\n"
-                            f"Status: {result.get('message', 'Success')}"
-                        )
+                    template, default = TRADE_EXECUTED_TEMPLATE, 'Success'
                 else:
-                    print(f"❌ Signal execution failed: {result.get('message', 'Unknown error')}")
-                    if self.discord:
-                        await self.discord.send_message(
-                            f"❌ **Trade Failed**\\n\\n"
-                            f"Signal: {signal.symbol} {signal.action.upper()}\\n"
-                            f"Error: {result.get('message', 'Unknown error')}"
-                        )
+                    template, default = TRADE_FAILED_TEMPLATE, 'Unknown error'
+                message = template.format(
+                    symbol=symbol,
+                    action=signal.action.upper(),
+                    message=result.get('message', default)
+                )
+            
+            # Format once; the terminal and the DM show the same text
+            print(message)
+            if batcher:
+                await batcher.process(message)
             
         except Exception as e:
-            self.error_handler.handle_exception(e, f"executing signal {signal.symbol}")
+            self.error_handler.handle_exception(e, f"executing signal {symbol}")
     
     async def run(self) -> None:
         """Run the trading bot"""
@@ -268,52 +408,104 @@ class TradingBotHTTP:
             self._running = True
             
             # Setup signal handlers for graceful shutdown
-            def signal_handler(signum, frame):
-                print(f"\\n🛑 Received signal {signum}, initiating shutdown...")
-                asyncio.create_task(self.shutdown())
-            
-            signal.signal(signal.SIGINT, signal_handler)
-            signal.signal(signal.SIGTERM, signal_handler)
+            self._setup_signal_handlers()
             
             print("🚀 Trading Bot started successfully!")
             print("📡 Monitoring Discord channels for signals...")
             print("💬 Send DM commands to the bot for control")
             print("🛑 Press Ctrl+C to stop")
             
-            # Wait for shutdown event
-            await self._shutdown_event.wait()
+            # Wait for shutdown
+            await self._shutdown_future
             
         except Exception as e:
             self.error_handler.handle_exception(e, "running bot")
             raise
     
+    def _setup_signal_handlers(self) -> None:
+        """Route SIGINT/SIGTERM to a graceful shutdown on the event loop"""
+        loop = asyncio.get_running_loop()
+        
+        if os.name == 'nt':
+            # Windows loops don't support add_signal_handler - hand off from the raw handler
+            def signal_handler(signum, frame):
+                loop.call_soon_threadsafe(self._on_os_signal, signum)
+            
+            signal.signal(signal.SIGINT, signal_handler)
+            signal.signal(signal.SIGTERM, signal_handler)
+            return
+        
+        # Runs the callback inside the loop and wakes it immediately
+        for signum in (signal.SIGINT, signal.SIGTERM):
+            loop.add_signal_handler(signum, self._on_os_signal, signum)
+    
+    def _on_os_signal(self, signum: int) -> None:
+        """Start shutdown from an OS signal (always called on the loop thread)"""
+        if self._shutdown_task is not None:
+            # Ctrl+C pressed again - the first shutdown is still running
+            return
+        print(f"\\n🛑 Received signal {signum}, initiating shutdown...")
+        self._shutdown_task = asyncio.get_running_loop().create_task(self.shutdown())
+    
     async def shutdown(self) -> None:
         """Shutdown the trading bot gracefully"""
         try:
             print("\\n🛑 Shutting down Trading Bot...")
             self._running = False
-            
-            # Shutdown components in reverse order
-            if self.discord:
-                await self.discord.shutdown()
-            
-            if self.trade_tracker:
-                await self.trade_tracker.shutdown()
-            
-            if self.trade_manager:
-                await self.trade_manager.shutdown()
-            
-            if self.exchange:
-                await self.exchange.shutdown()
-            
-            if self.performance_monitor:
-                await self.performance_monitor.shutdown()
-            
+            self._stop_signal_queue()
+            
+            # Stop everything that uses the exchange first, then the exchange and the rest
+            await self._shutdown_components(
+                self._notify_and_close_discord() if self.discord else None,
+                self.trade_tracker.shutdown() if self.trade_tracker else None,
+                self.trade_manager.shutdown() if self.trade_manager else None,
+                self.signal_parser.shutdown() if self.signal_parser else None
+            )
+            await self._shutdown_components(
+                self.exchange.shutdown() if self.exchange else None,
+                self.config_manager.shutdown() if self.config_manager else None,
+                self.performance_monitor.shutdown() if self.performance_monitor else None
+            )
+            
+            self.error_handler.flush_suppressed()
             print("✅ Trading Bot shutdown complete")
-            self._shutdown_event.set()
+            if self._shutdown_future and not self._shutdown_future.done():
+                self._shutdown_future.set_result(None)
             
         except Exception as e:
             self.error_handler.handle_exception(e, "shutting down bot")
+    
+    async def _shutdown_components(self, *coros) -> None:
+        """Run component shutdowns concurrently, logging any that fail"""
+        async with asyncio.TaskGroup() as group:
+            for coro in coros:
+                if coro is not None:
+                    group.create_task(self._safe_shutdown(coro))
+    
+    async def _safe_shutdown(self, coro) -> None:
+        """Await one component shutdown so its failure can't cancel the others"""
+        try:
+            await coro
+        except Exception as e:
+            self.error_handler.handle_exception(e, "shutting down component")
+    
+    async def _notify_and_close_discord(self) -> None:
+        """Send the shutdown notice without letting a slow Discord stall shutdown"""
+        try:
+            if self._msg_batcher:
+                # Queued trade notices go out with the shutdown notice
+                await self._msg_batcher.process("🛑 Trading bot shutting down...")
+                await asyncio.wait_for(self._msg_batcher.stop(), timeout=SHUTDOWN_NOTIFY_TIMEOUT)
+            else:
+                await asyncio.wait_for(
+                    self.discord.send_message("🛑 Trading bot shutting down..."),
+                    timeout=SHUTDOWN_NOTIFY_TIMEOUT
+                )
+        except asyncio.TimeoutError:
+            self.error_handler.log_warning("Shutdown notice timed out")
+        except Exception as e:
+            self.error_handler.handle_exception(e, "sending shutdown notice")
+        await self.discord.shutdown()
 
 
 async def main():
@@ -321,6 +513,8 @@ async def main():
     try:
         # Load environment variables
         load_dotenv()
+        # LOG_LEVEL=INFO silences per-signal debug output in production
+        get_error_handler().set_log_level(os.getenv("LOG_LEVEL", "DEBUG"))
         
         # Create and initialize bot
         bot = TradingBotHTTP()
@@ -337,14 +531,21 @@ async def main():
         traceback.print_exc()
     finally:
         try:
-            await bot.shutdown()
+            if bot._shutdown_task is not None:
+                # A signal already started shutdown - wait for it rather than running it twice
+                await bot._shutdown_task
+            else:
+                await bot.shutdown()
         except:
             pass
 
 
 if __name__ == "__main__":
     try:
-        asyncio.run(main())
+        if uvloop is not None:
+            uvloop.run(main())
+        else:
+            asyncio.run(main())
     except KeyboardInterrupt:
         print("\\n👋 Goodbye!")
     except Exception as e:
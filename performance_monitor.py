@@ -4,10 +4,14 @@ Monitors execution times, memory usage, and API call statistics
 """
 
 import asyncio
+import sys
 import time
 try:
     import psutil
+    # Failures a single psutil probe can raise (access denied, process gone, /proc read errors)
+    PSUTIL_ERRORS = (psutil.Error, OSError)
 except ImportError:
+    PSUTIL_ERRORS = (OSError,)
     # Use lightweight replacement for Termux compatibility
     from system_info import cpu_percent, virtual_memory, boot_time
     
@@ -23,21 +27,37 @@ except ImportError:
         @staticmethod
         def boot_time():
             return boot_time()
-import json
 from typing import Dict, List, Any, Optional
 from datetime import datetime, timedelta
-from collections import deque, defaultdict
+from collections import deque
 from dataclasses import dataclass, asdict
 from error_handler import get_error_handler
+import fast_json
+
+
+# Per-minute rollups kept for windowed success-rate / latency queries (24 hours)
+MINUTE_BUCKETS = 1440
+
+# System sampling cadence: every minute while loaded, every 5 minutes while idle
+MONITOR_INTERVAL_BUSY = 60
+MONITOR_INTERVAL_IDLE = 300
+
+# Smoothed load (0-1) above which sampling stays at the busy cadence, and the smoothing weight
+MONITOR_BUSY_THRESHOLD = 0.5
+MONITOR_LOAD_ALPHA = 0.2
+
+# Seconds a performance summary snapshot is reused before /proc is sampled again
+SUMMARY_CACHE_TTL = 1.0
 
 
 @dataclass
 class PerformanceMetric:
+    __slots__ = ('timestamp', 'operation', 'duration', 'success', 'error_type')
     timestamp: float
     operation: str
     duration: float
     success: bool
-    error_type: Optional[str] = None
+    error_type: Optional[str]
 
 
 @dataclass
@@ -50,21 +70,50 @@ class SystemMetrics:
     uptime_hours: float
 
 
+class _OpStats:
+    """Running totals for one operation name"""
+    
+    __slots__ = ('count', 'total_time', 'success_count', 'error_count', 'avg_time', 'success_rate',
+                 'last_error')
+    
+    def __init__(self):
+        self.count = 0
+        self.total_time = 0.0
+        self.success_count = 0
+        self.error_count = 0
+        self.avg_time = 0.0
+        self.success_rate = 0.0
+        self.last_error: Optional[str] = None
+    
+    def as_dict(self) -> Dict[str, Any]:
+        """Plain dict view for callers that expect the old stats mapping"""
+        return {name: getattr(self, name) for name in self.__slots__}
+
+
 class PerformanceMonitor:
     def __init__(self, max_history: int = 1000):
         self.error_handler = get_error_handler()
         self.max_history = max_history
         self.metrics: deque = deque(maxlen=max_history)
-        self.operation_stats: Dict[str, Dict] = defaultdict(lambda: {
-            'count': 0,
-            'total_time': 0,
-            'success_count': 0,
-            'error_count': 0,
-            'avg_time': 0,
-            'last_error': None
-        })
+        self.operation_stats: Dict[str, _OpStats] = {}
         self.start_time = time.time()
+        # [minute, count, total_duration, success_count], oldest first
+        self._minute_buckets: deque = deque(maxlen=MINUTE_BUCKETS)
+        # EWMA of max(cpu, memory) load; starts high so the first few samples come at the busy cadence
+        self._load_ewma = 1.0
         self._monitoring_task: Optional[asyncio.Task] = None
+        self._summary_cache: Optional[Dict[str, Any]] = None
+        self._summary_cache_ts = 0.0
+        
+        # One process handle for the monitor's lifetime instead of reopening /proc/self per sample
+        try:
+            self._proc = psutil.Process()
+            self._proc.cpu_percent(interval=None)  # prime the counter so later calls return a delta
+            self._total_memory = psutil.virtual_memory().total
+        except Exception:
+            # The Termux psutil stand-in has no per-process stats
+            self._proc = None
+            self._total_memory = 0
     
     async def initialize(self) -> None:
         """Initialize performance monitoring"""
@@ -85,58 +134,64 @@ class PerformanceMonitor:
         """Continuous system monitoring"""
         while True:
             try:
-                await asyncio.sleep(60)  # Monitor every minute
-                await self._collect_system_metrics()
+                busy = self._load_ewma > MONITOR_BUSY_THRESHOLD
+                await asyncio.sleep(MONITOR_INTERVAL_BUSY if busy else MONITOR_INTERVAL_IDLE)
+                load = await self._collect_system_metrics()
+                if load is None:
+                    # No process stats on this platform - nothing to adapt to
+                    self._load_ewma = 0.0
+                else:
+                    self._load_ewma += MONITOR_LOAD_ALPHA * (load - self._load_ewma)
             except asyncio.CancelledError:
                 break
             except Exception as e:
                 self.error_handler.handle_exception(e, "system monitoring")
                 await asyncio.sleep(60)
     
-    async def _collect_system_metrics(self) -> None:
-        """Collect system performance metrics"""
+    async def _collect_system_metrics(self) -> Optional[float]:
+        """Collect system metrics and return the 0-1 load (errors propagate to _monitor_system)"""
+        process = self._proc
+        if process is None:
+            return None
+        
+        # CPU and memory - one memory_info read serves both figures
+        cpu_percent = process.cpu_percent(interval=None)
+        memory_info = process.memory_info()
+        memory_percent = memory_info.rss / self._total_memory * 100
+        
+        # File handles and connections
         try:
-            process = psutil.Process()
-            
-            # CPU and memory
-            cpu_percent = process.cpu_percent()
-            memory_info = process.memory_info()
-            memory_percent = process.memory_percent()
-            
-            # File handles and connections
-            try:
-                open_files = len(process.open_files())
-            except:
-                open_files = 0
-            
-            try:
-                connections = len(process.connections())
-            except:
-                connections = 0
-            
-            uptime_hours = (time.time() - self.start_time) / 3600
-            
-            system_metrics = SystemMetrics(
-                cpu_percent=cpu_percent,
-                memory_percent=memory_percent,
-                memory_used_mb=memory_info.rss / 1024 / 1024,
-                open_files=open_files,
-                network_connections=connections,
-                uptime_hours=uptime_hours
-            )
-            
-            # Log warnings for high resource usage
-            if cpu_percent > 80:
-                self.error_handler.log_warning(f"High CPU usage: {cpu_percent:.1f}%")
-            
-            if memory_percent > 80:
-                self.error_handler.log_warning(f"High memory usage: {memory_percent:.1f}%")
-            
-            if open_files > 100:
-                self.error_handler.log_warning(f"High file handle count: {open_files}")
-                
-        except Exception as e:
-            self.error_handler.handle_exception(e, "collecting system metrics")
+            open_files = len(process.open_files())
+        except PSUTIL_ERRORS:
+            open_files = 0
+        
+        try:
+            connections = len(process.connections())
+        except PSUTIL_ERRORS:
+            connections = 0
+        
+        uptime_hours = (time.time() - self.start_time) / 3600
+        
+        system_metrics = SystemMetrics(
+            cpu_percent=cpu_percent,
+            memory_percent=memory_percent,
+            memory_used_mb=memory_info.rss / 1024 / 1024,
+            open_files=open_files,
+            network_connections=connections,
+            uptime_hours=uptime_hours
+        )
+        
+        # Log warnings for high resource usage
+        if cpu_percent > 80:
+            self.error_handler.log_warning(f"High CPU usage: {cpu_percent:.1f}%")
+        
+        if memory_percent > 80:
+            self.error_handler.log_warning(f"High memory usage: {memory_percent:.1f}%")
+        
+        if open_files > 100:
+            self.error_handler.log_warning(f"High file handle count: {open_files}")
+        
+        return max(cpu_percent, memory_percent) / 100
     
     def time_operation(self, operation_name: str):
         """Context manager for timing operations"""
@@ -144,6 +199,9 @@ class PerformanceMonitor:
     
     def record_metric(self, operation: str, duration: float, success: bool, error_type: str = None) -> None:
         """Record a performance metric"""
+        # One shared string per operation name across stored metrics and stats keys
+        operation = sys.intern(operation)
+        
         metric = PerformanceMetric(
             timestamp=time.time(),
             operation=operation,
@@ -153,19 +211,34 @@ class PerformanceMonitor:
         )
         
         self.metrics.append(metric)
+        self._summary_cache = None
+        
+        # Roll the metric into its minute so window queries don't rescan the history
+        minute = int(metric.timestamp // 60)
+        buckets = self._minute_buckets
+        if buckets and buckets[-1][0] == minute:
+            bucket = buckets[-1]
+            bucket[1] += 1
+            bucket[2] += duration
+            bucket[3] += success
+        else:
+            buckets.append([minute, 1, duration, int(success)])
         
         # Update operation statistics
-        stats = self.operation_stats[operation]
-        stats['count'] += 1
-        stats['total_time'] += duration
+        stats = self.operation_stats.get(operation)
+        if stats is None:
+            stats = self.operation_stats[operation] = _OpStats()
+        stats.count += 1
+        stats.total_time += duration
         
         if success:
-            stats['success_count'] += 1
+            stats.success_count += 1
         else:
-            stats['error_count'] += 1
-            stats['last_error'] = error_type
+            stats.error_count += 1
+            stats.last_error = error_type
         
-        stats['avg_time'] = stats['total_time'] / stats['count']
+        stats.avg_time = stats.total_time / stats.count
+        stats.success_rate = stats.success_count / stats.count * 100
         
         # Log slow operations
         if duration > 5.0:  # Log operations slower than 5 seconds
@@ -174,23 +247,43 @@ class PerformanceMonitor:
     def get_operation_stats(self, operation: str = None) -> Dict[str, Any]:
         """Get statistics for specific operation or all operations"""
         if operation:
-            return dict(self.operation_stats.get(operation, {}))
+            stats = self.operation_stats.get(operation)
+            return stats.as_dict() if stats else {}
         else:
-            return {op: dict(stats) for op, stats in self.operation_stats.items()}
+            return {op: stats.as_dict() for op, stats in self.operation_stats.items()}
     
     def get_recent_metrics(self, minutes: int = 60) -> List[PerformanceMetric]:
         """Get metrics from the last N minutes"""
         cutoff_time = time.time() - (minutes * 60)
-        return [m for m in self.metrics if m.timestamp >= cutoff_time]
+        # History is append-ordered by time - walk back from the newest and stop at the cutoff
+        recent = []
+        for metric in reversed(self.metrics):
+            if metric.timestamp < cutoff_time:
+                break
+            recent.append(metric)
+        recent.reverse()
+        return recent
+    
+    def _window_totals(self, minutes: int) -> tuple:
+        """Sum (count, total_duration, success_count) over the last N minute buckets"""
+        cutoff = int((time.time() - minutes * 60) // 60)
+        count = success = 0
+        total_time = 0.0
+        for minute, bucket_count, bucket_time, bucket_success in reversed(self._minute_buckets):
+            if minute < cutoff:
+                break
+            count += bucket_count
+            total_time += bucket_time
+            success += bucket_success
+        return count, total_time, success
     
     def get_success_rate(self, operation: str = None, minutes: int = 60) -> float:
         """Get success rate for operations"""
-        recent_metrics = self.get_recent_metrics(minutes)
+        if operation is None:
+            count, _, success = self._window_totals(minutes)
+            return (success / count) * 100 if count else 0.0
         
-        if operation:
-            relevant_metrics = [m for m in recent_metrics if m.operation == operation]
-        else:
-            relevant_metrics = recent_metrics
+        relevant_metrics = [m for m in self.get_recent_metrics(minutes) if m.operation == operation]
         
         if not relevant_metrics:
             return 0.0
@@ -200,12 +293,11 @@ class PerformanceMonitor:
     
     def get_average_response_time(self, operation: str = None, minutes: int = 60) -> float:
         """Get average response time for operations"""
-        recent_metrics = self.get_recent_metrics(minutes)
+        if operation is None:
+            count, total_time, _ = self._window_totals(minutes)
+            return total_time / count if count else 0.0
         
-        if operation:
-            relevant_metrics = [m for m in recent_metrics if m.operation == operation]
-        else:
-            relevant_metrics = recent_metrics
+        relevant_metrics = [m for m in self.get_recent_metrics(minutes) if m.operation == operation]
         
         if not relevant_metrics:
             return 0.0
@@ -214,7 +306,11 @@ class PerformanceMonitor:
         return total_time / len(relevant_metrics)
     
     def get_performance_summary(self) -> Dict[str, Any]:
-        """Get comprehensive performance summary"""
+        """Get comprehensive performance summary (shared snapshot, reused for SUMMARY_CACHE_TTL)"""
+        now = time.monotonic()
+        if self._summary_cache is not None and now - self._summary_cache_ts < SUMMARY_CACHE_TTL:
+            return self._summary_cache
+        
         uptime_hours = (time.time() - self.start_time) / 3600
         
         summary = {
@@ -228,35 +324,41 @@ class PerformanceMonitor:
         # Operations by type
         for operation, stats in self.operation_stats.items():
             summary['operations_by_type'][operation] = {
-                'count': stats['count'],
-                'success_rate': (stats['success_count'] / stats['count'] * 100) if stats['count'] > 0 else 0,
-                'avg_time': round(stats['avg_time'], 3),
-                'last_error': stats['last_error']
+                'count': stats.count,
+                'success_rate': stats.success_rate,
+                'avg_time': round(stats.avg_time, 3),
+                'last_error': stats.last_error
             }
         
-        # Recent performance (last hour)
+        # Recent performance (last hour) - one pass over the minute buckets
+        count, total_time, success = self._window_totals(60)
         summary['recent_performance'] = {
-            'success_rate': round(self.get_success_rate(minutes=60), 2),
-            'avg_response_time': round(self.get_average_response_time(minutes=60), 3),
-            'operations_count': len(self.get_recent_metrics(60))
+            'success_rate': round((success / count) * 100 if count else 0.0, 2),
+            'avg_response_time': round(total_time / count if count else 0.0, 3),
+            'operations_count': count
         }
         
         # System health indicators
+        process = self._proc
         try:
-            process = psutil.Process()
+            if process is None:
+                raise OSError("process stats unavailable")
+            rss = process.memory_info().rss
             summary['system_health'] = {
-                'cpu_percent': round(process.cpu_percent(), 1),
-                'memory_percent': round(process.memory_percent(), 1),
-                'memory_mb': round(process.memory_info().rss / 1024 / 1024, 1),
+                'cpu_percent': round(process.cpu_percent(interval=None), 1),
+                'memory_percent': round(rss / self._total_memory * 100, 1),
+                'memory_mb': round(rss / 1024 / 1024, 1),
                 'threads': process.num_threads()
             }
-        except:
+        except PSUTIL_ERRORS:
             summary['system_health'] = {'error': 'Unable to collect system metrics'}
         
+        self._summary_cache = summary
+        self._summary_cache_ts = now
         return summary
     
-    def export_metrics(self, filepath: str = None) -> str:
-        """Export metrics to JSON file"""
+    async def export_metrics(self, filepath: str = None) -> str:
+        """Export metrics to JSON file without blocking the event loop"""
         if filepath is None:
             filepath = f"performance_metrics_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
         
@@ -268,8 +370,8 @@ class PerformanceMonitor:
         }
         
         try:
-            with open(filepath, 'w') as f:
-                json.dump(export_data, f, indent=2)
+            # Snapshot is taken above on the loop; encoding and disk I/O run on a worker thread
+            await asyncio.to_thread(_write_json, filepath, export_data)
             
             self.error_handler.log_success(f"Performance metrics exported to {filepath}")
             return filepath
@@ -278,6 +380,13 @@ class PerformanceMonitor:
             return ""
 
 
+def _write_json(filepath: str, data: Dict[str, Any]) -> None:
+    """Encode data (orjson when available) and write it to filepath"""
+    payload = fast_json.dumps(data, indent=True)
+    with open(filepath, 'w') as f:
+        f.write(payload)
+
+
 class OperationTimer:
     """Context manager for timing operations"""
     
@@ -289,11 +398,11 @@ class OperationTimer:
         self.error_type = None
     
     def __enter__(self):
-        self.start_time = time.time()
+        self.start_time = time.perf_counter()
         return self
     
     def __exit__(self, exc_type, exc_val, exc_tb):
-        duration = time.time() - self.start_time
+        duration = time.perf_counter() - self.start_time
         
         if exc_type is not None:
             self.success = False
@@ -6,16 +6,197 @@ Processes text and image content to extract trading information with rate limiti
 import asyncio
 import json
 import base64
+import hashlib
+import io
 import os
 import re
 import time
+from collections import OrderedDict, deque
 from typing import Dict, List, Optional, Any, Union, Tuple
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass, replace
 from datetime import datetime, timedelta
 import requests
+from requests.adapters import HTTPAdapter
+import fast_json
+from fast_path import check_signal_levels
 from error_handler import get_error_handler
 from performance_monitor import get_performance_monitor
 
+try:
+    from pybase64 import b64encode_as_string
+except ImportError:
+    # pybase64 is an optional SIMD build; stdlib base64 is the same encoding
+    def b64encode_as_string(data: bytes) -> str:
+        return base64.b64encode(data).decode('ascii')
+
+try:
+    from PIL import Image
+except ImportError:
+    # Without Pillow images are sent to Gemini as downloaded
+    Image = None
+
+
+# Gemini requests allowed in flight at once; the per-minute budget is enforced separately
+GEMINI_MAX_CONCURRENCY = 10
+
+# Largest image sent to Gemini; bigger attachments are skipped before their body is read
+MAX_IMAGE_BYTES = 20 * 1024 * 1024
+
+# Keep-alive connections per host; enough for every concurrent Gemini call and image download
+HTTP_POOL_MAXSIZE = GEMINI_MAX_CONCURRENCY
+
+# Text signals coalesced into one Gemini request, and how long the first one waits for company
+GEMINI_BATCH_MAX_SIZE = 8
+GEMINI_BATCH_MAX_WAIT = 0.05
+
+# JSON in a Gemini reply: a fenced block (```json / ```JSON / bare ```) wins over the outermost braces
+_JSON_FENCE_RE = re.compile(r'```(?:json)?\s*(\{.*?\})\s*```', re.IGNORECASE | re.DOTALL)
+_JSON_OBJECT_RE = re.compile(r'\{.*\}', re.DOTALL)
+_JSON_ARRAY_FENCE_RE = re.compile(r'```(?:json)?\s*(\[.*?\])\s*```', re.IGNORECASE | re.DOTALL)
+_JSON_ARRAY_RE = re.compile(r'\[.*\]', re.DOTALL)
+
+
+def _extract_json(text: str, fence_re: re.Pattern, bare_re: re.Pattern) -> Optional[str]:
+    """Pull the JSON document out of model text, preferring a fenced block"""
+    match = fence_re.search(text)
+    if match:
+        return match.group(1)
+    match = bare_re.search(text)
+    return match.group(0) if match else None
+
+
+# Regex fallback parser patterns, compiled once; symbol and price patterns are tried in order
+_REGEX_SEPARATORS = str.maketrans('', '', '/-_')
+_REGEX_SYMBOL_PATTERNS = tuple(re.compile(p) for p in (
+    r'#([A-Z]{2,6})USDT',
+    r'([A-Z]{2,6})USDT',
+    r'([A-Z]{2,6})/USDT',
+    r'#([A-Z]{2,6})'
+))
+_REGEX_SHORT_WORDS = re.compile(r'SHORT|SELL|BEAR')
+_REGEX_LONG_WORDS = re.compile(r'LONG|BUY|BULL')
+_REGEX_PRICE_PATTERNS = tuple(re.compile(p) for p in (
+    r'ENTRY[:\s]*(\d+\.?\d*)',
+    r'BUY[:\s]*(\d+\.?\d*)',
+    r'PRICE[:\s]*(\d+\.?\d*)',
+    r'(\d+\.?\d*)'  # Any number as fallback
+))
+_REGEX_LEVERAGE = re.compile(r'(\d+)X|LEVERAGE[:\s]*(\d+)')
+
+# Gemini gains nothing past ~1.5k px, so larger images are shrunk and re-encoded before upload
+IMAGE_MAX_EDGE = 1536
+IMAGE_JPEG_QUALITY = 85
+# Images already this small are sent untouched
+IMAGE_RECOMPRESS_MIN_BYTES = 256 * 1024
+
+# Parsed signals remembered so a re-posted signal skips the Gemini round-trip
+SIGNAL_CACHE_SIZE = 100
+
+# Parsed signals survive restarts in this file for up to a week
+SIGNAL_CACHE_FILE = "signal_cache.json"
+SIGNAL_CACHE_TTL = 7 * 24 * 3600
+
+# Whitespace runs collapsed before hashing so formatting differences still hit the cache
+_WHITESPACE_RE = re.compile(r'\s+')
+
+
+def _prepare_image(data: bytes) -> bytes:
+    """Downscale and JPEG-recompress a large image; returns the original on any failure"""
+    if Image is None or len(data) < IMAGE_RECOMPRESS_MIN_BYTES:
+        return data
+    try:
+        with Image.open(io.BytesIO(data)) as img:
+            if max(img.size) > IMAGE_MAX_EDGE:
+                img.thumbnail((IMAGE_MAX_EDGE, IMAGE_MAX_EDGE), Image.LANCZOS)
+            buf = io.BytesIO()
+            img.convert('RGB').save(buf, 'JPEG', quality=IMAGE_JPEG_QUALITY)
+    except Exception as e:
+        print(f"⚠️ Could not recompress image, sending original: {e}")
+        return data
+    
+    compressed = buf.getvalue()
+    return compressed if len(compressed) < len(data) else data
+
+
+def _fetch_image_base64(session: requests.Session, image_url: str) -> Optional[str]:
+    """Download an image and base64-encode it, refusing oversized bodies"""
+    with session.get(image_url, timeout=10, stream=True) as response:
+        if response.status_code != 200:
+            return None
+        
+        declared = response.headers.get('Content-Length')
+        if declared and declared.isdigit() and int(declared) > MAX_IMAGE_BYTES:
+            print(f"⚠️ Skipping image over {MAX_IMAGE_BYTES // (1024 * 1024)} MB: {image_url}")
+            return None
+        
+        # Content-Length can be missing, so cap the read as well
+        data = response.raw.read(MAX_IMAGE_BYTES + 1, decode_content=True)
+        if len(data) > MAX_IMAGE_BYTES:
+            print(f"⚠️ Skipping image over {MAX_IMAGE_BYTES // (1024 * 1024)} MB: {image_url}")
+            return None
+        return b64encode_as_string(_prepare_image(data))
+
+
+def _write_signal_cache(filepath: str, data: Dict[str, Any]) -> None:
+    """Atomically replace the signal cache file so a crash never leaves it half-written"""
+    tmp_path = filepath + ".tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(fast_json.dumps_bytes(data))
+    os.replace(tmp_path, filepath)
+
+
+def _signal_cache_key(content: str, images: Optional[List[str]]) -> str:
+    """Stable digest of case- and whitespace-normalized content plus image URLs"""
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(_WHITESPACE_RE.sub(' ', content.lower()).strip().encode('utf-8'))
+    for image_url in images or ():
+        digest.update(b'\0')
+        digest.update(image_url.encode('utf-8'))
+    return digest.hexdigest()
+
+
+# Pieces of a signal that identify the trade regardless of wording
+_FINGERPRINT_SYMBOL_RE = re.compile(r'\b([A-Z]{2,10})(?:[/_\-]?USDT)\b|#([A-Z]{2,10})\b')
+_FINGERPRINT_NUMBER_RE = re.compile(r'(?<![\w.])\d+(?:\.\d+)?(?![\w.])')
+_FINGERPRINT_SHORT_RE = re.compile(r'\b(?:SHORT|SELL)\b')
+_FINGERPRINT_LONG_RE = re.compile(r'\b(?:LONG|BUY)\b')
+_FINGERPRINT_LEVERAGE_RE = re.compile(r'\b(\d+)\s*X\b|\bX\s*(\d+)\b|LEVERAGE[:\s]*(\d+)')
+_FINGERPRINT_SPOT_RE = re.compile(r'\bSPOT\b')
+_FINGERPRINT_FUTURES_RE = re.compile(r'\b(?:FUTURES?|PERP(?:ETUAL)?S?)\b')
+
+# Leverage both parsers assume when a signal doesn't state one
+DEFAULT_SIGNAL_LEVERAGE = 10
+
+# (symbol, direction, stated leverage or None, trade type, price levels)
+_Fingerprint = Tuple[str, str, Optional[int], str, frozenset]
+
+
+def _signal_fingerprint(content: str) -> Optional[_Fingerprint]:
+    """Every trade parameter stated in the text, so reworded posts of the same trade match"""
+    upper = content.upper()
+    symbols = {(a or b).removesuffix('USDT') or 'USDT' for a, b in _FINGERPRINT_SYMBOL_RE.findall(upper)}
+    if len(symbols) != 1:
+        return None
+    
+    is_short = _FINGERPRINT_SHORT_RE.search(upper) is not None
+    if is_short == (_FINGERPRINT_LONG_RE.search(upper) is not None):
+        return None
+    
+    # Leverage and market type change the trade as much as the prices do
+    leverages = {int(a or b or c) for a, b, c in _FINGERPRINT_LEVERAGE_RE.findall(upper)}
+    if len(leverages) > 1:
+        return None
+    leverage = leverages.pop() if leverages else None
+    
+    is_spot = _FINGERPRINT_SPOT_RE.search(upper) is not None
+    if is_spot and _FINGERPRINT_FUTURES_RE.search(upper):
+        return None
+    
+    numbers = frozenset(float(n) for n in _FINGERPRINT_NUMBER_RE.findall(upper))
+    if len(numbers) < 3:
+        return None
+    return symbols.pop(), 'sell' if is_short else 'buy', leverage, 'spot' if is_spot else 'futures', numbers
+
 
 @dataclass
 class TradeSignal:
@@ -43,29 +224,34 @@ class TradeSignal:
 
 
 class RateLimiter:
-    """Simple rate limiter for API calls"""
+    """Sliding-window rate limiter for API calls"""
     
     def __init__(self, requests_per_minute: int):
         self.requests_per_minute = requests_per_minute
-        self.requests = []
+        # Start times of recent and already-reserved requests, oldest first
+        self.requests: deque = deque()
     
     async def wait_if_needed(self):
         """Wait if rate limit would be exceeded"""
-        now = time.time()
+        now = time.monotonic()
+        requests = self.requests
         
         # Remove requests older than 1 minute
-        self.requests = [req_time for req_time in self.requests if now - req_time < 60]
+        while requests and now - requests[0] >= 60:
+            requests.popleft()
         
-        # Check if we need to wait
-        if len(self.requests) >= self.requests_per_minute:
-            oldest_request = min(self.requests)
-            wait_time = 60 - (now - oldest_request)
-            if wait_time > 0:
-                print(f"⏳ Rate limit reached, waiting {wait_time:.1f} seconds...")
-                await asyncio.sleep(wait_time)
+        # Reserve the earliest free slot before sleeping so concurrent callers queue up
+        # behind each other instead of all waking on the same slot
+        if len(requests) >= self.requests_per_minute:
+            slot = requests[-self.requests_per_minute] + 60
+        else:
+            slot = now
+        requests.append(slot)
         
-        # Record this request
-        self.requests.append(now)
+        wait_time = slot - now
+        if wait_time > 0:
+            print(f"⏳ Rate limit reached, waiting {wait_time:.1f} seconds...")
+            await asyncio.sleep(wait_time)
 
 
 class SignalParserHTTP:
@@ -82,7 +268,22 @@ class SignalParserHTTP:
             print(f"🔑 Key length: {len(self.gemini_api_key)} characters")
         
         self.rate_limiter = RateLimiter(60)  # 60 requests per minute
-        self.signal_cache: Dict[str, TradeSignal] = {}
+        # One pooled session so each Gemini call reuses a warm TLS connection instead of handshaking
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_maxsize=HTTP_POOL_MAXSIZE)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        self._gemini_slots = asyncio.Semaphore(GEMINI_MAX_CONCURRENCY)
+        # Text-only parses wait here to share a request; the worker starts on first use
+        self._gemini_batch_queue: asyncio.Queue = asyncio.Queue()
+        self._gemini_batch_task: Optional[asyncio.Task] = None
+        self._gemini_batch_jobs: set = set()
+        # digest -> (wall-clock time parsed, signal), oldest first
+        self.signal_cache: "OrderedDict[str, Tuple[float, TradeSignal]]" = self._load_signal_cache()
+        self._cache_dirty = False
+        self._cache_save_task: Optional[asyncio.Task] = None
+        # Second lookup for reworded reposts; see _signal_fingerprint
+        self._fingerprint_cache: "OrderedDict[_Fingerprint, TradeSignal]" = OrderedDict()
         
         if self.gemini_api_key:
             print("🤖 Signal Parser Mode: GEMINI AI ONLY")
@@ -93,31 +294,155 @@ class SignalParserHTTP:
         
         self.error_handler.log_startup("Signal Parser HTTP")
     
+    async def shutdown(self) -> None:
+        """Stop the batch worker, flush the signal cache and close pooled connections"""
+        if self._gemini_batch_task:
+            self._gemini_batch_task.cancel()
+            try:
+                await self._gemini_batch_task
+            except asyncio.CancelledError:
+                pass
+            self._gemini_batch_task = None
+        
+        # Batches still in flight would otherwise post on the session closed below;
+        # cancelling resolves their callers with None
+        jobs = list(self._gemini_batch_jobs)
+        for job in jobs:
+            job.cancel()
+        await asyncio.gather(*jobs, return_exceptions=True)
+        
+        # Release callers still waiting for a batch that will never be sent
+        queue = self._gemini_batch_queue
+        while not queue.empty():
+            future = queue.get_nowait()[2]
+            if not future.done():
+                future.set_result(None)
+        
+        if self._cache_save_task:
+            await self._cache_save_task
+        
+        self.session.close()
+        self.error_handler.log_shutdown("Signal Parser HTTP")
+    
     async def parse_signal(self, content: str, images: List[str] = None, source: str = "") -> Optional[TradeSignal]:
         """Parse trading signal from content and images"""
         try:
             if not content and not images:
                 return None
             
+            cache = self.signal_cache
+            cache_key = _signal_cache_key(content or "", images)
+            entry = cache.get(cache_key)
+            if entry is not None:
+                if time.time() - entry[0] < SIGNAL_CACHE_TTL:
+                    cache.move_to_end(cache_key)
+                    return replace(entry[1], source=source)
+                del cache[cache_key]
+            
+            # Images can change the trade, so only text signals are matched by fingerprint
+            fingerprint = _signal_fingerprint(content) if content and not images else None
+            if fingerprint is not None:
+                cached = self._fingerprint_cache.get(fingerprint)
+                if cached is not None:
+                    self._fingerprint_cache.move_to_end(fingerprint)
+                    return replace(cached, source=source, raw_content=content)
+            
+            signal = None
             # Try Gemini AI parsing first if available
             if self.gemini_api_key:
                 signal = await self._parse_with_gemini(content, images, source)
-                if signal:
-                    return signal
             
             # Fallback to regex parsing
-            signal = await self._parse_with_regex(content, source)
+            if not signal:
+                signal = await self._parse_with_regex(content, source)
+            
+            if signal:
+                cache[cache_key] = (time.time(), signal)
+                if len(cache) > SIGNAL_CACHE_SIZE:
+                    cache.popitem(last=False)
+                self._schedule_cache_save()
+                self._remember_fingerprint(fingerprint, signal)
             return signal
             
         except Exception as e:
             self.error_handler.handle_exception(e, "parsing signal")
             return None
     
+    def _load_signal_cache(self) -> "OrderedDict[str, Tuple[float, TradeSignal]]":
+        """Load unexpired parses saved by a previous run"""
+        cache: "OrderedDict[str, Tuple[float, TradeSignal]]" = OrderedDict()
+        if not os.path.exists(SIGNAL_CACHE_FILE):
+            return cache
+        
+        try:
+            with open(SIGNAL_CACHE_FILE, 'rb') as f:
+                saved = fast_json.loads(f.read())
+            
+            cutoff = time.time() - SIGNAL_CACHE_TTL
+            for key, (saved_at, signal_data) in saved.items():
+                if saved_at > cutoff:
+                    cache[key] = (saved_at, TradeSignal(**signal_data))
+            
+            # Keep only the newest entries if the file predates a smaller cap
+            while len(cache) > SIGNAL_CACHE_SIZE:
+                cache.popitem(last=False)
+            
+            if cache:
+                print(f"📂 Loaded {len(cache)} cached signal parses")
+        except Exception as e:
+            self.error_handler.handle_exception(e, "loading signal cache")
+        return cache
+    
+    def _schedule_cache_save(self) -> None:
+        """Persist the cache in the background, coalescing saves requested meanwhile"""
+        self._cache_dirty = True
+        if self._cache_save_task is None:
+            self._cache_save_task = asyncio.create_task(self._save_signal_cache())
+    
+    async def _save_signal_cache(self) -> None:
+        """Write the cache to disk until no further changes are pending"""
+        try:
+            while self._cache_dirty:
+                self._cache_dirty = False
+                # Snapshot on the loop; encoding and disk I/O run on a worker thread
+                snapshot = {
+                    key: [saved_at, asdict(signal)]
+                    for key, (saved_at, signal) in self.signal_cache.items()
+                }
+                await asyncio.to_thread(_write_signal_cache, SIGNAL_CACHE_FILE, snapshot)
+        except Exception as e:
+            self.error_handler.handle_exception(e, "saving signal cache")
+        finally:
+            self._cache_save_task = None
+    
+    def _remember_fingerprint(self, fingerprint: Optional[_Fingerprint], signal: TradeSignal) -> None:
+        """Cache a parsed signal by fingerprint if the parse agrees with it"""
+        if fingerprint is None:
+            return
+        symbol, action, leverage, trade_type, numbers = fingerprint
+        # Only reuse a parse whose every parameter came from the text itself (or its default)
+        if (signal.action != action
+                or not signal.symbol.startswith(symbol)
+                or signal.leverage != (leverage or DEFAULT_SIGNAL_LEVERAGE)
+                or signal.trade_type != trade_type
+                or not {signal.entry_price, signal.stop_loss, signal.take_profit} <= numbers):
+            return
+        
+        fingerprints = self._fingerprint_cache
+        fingerprints[fingerprint] = signal
+        if len(fingerprints) > SIGNAL_CACHE_SIZE:
+            fingerprints.popitem(last=False)
+    
     async def _parse_with_gemini(self, content: str, images: List[str] = None, source: str = "") -> Optional[TradeSignal]:
         """Parse signal using Gemini AI API"""
+        # Image tokens dominate an image request, so only text signals are worth batching
+        if not images:
+            return await self._parse_text_batched(content, source)
+        return await self._parse_single_with_gemini(content, images, source)
+    
+    async def _parse_single_with_gemini(self, content: str, images: List[str] = None, source: str = "") -> Optional[TradeSignal]:
+        """Parse one signal with its own Gemini request"""
         try:
-            await self.rate_limiter.wait_if_needed()
-            
             # Prepare the prompt
             prompt = self._create_gemini_prompt()
             
@@ -140,56 +465,174 @@ class SignalParserHTTP:
                     except Exception as e:
                         print(f"⚠️ Failed to process image {image_url}: {e}")
             
-            payload = {
-                "contents": [{"parts": parts}],
-                "generationConfig": {
-                    "temperature": 0.1,
-                    "topK": 1,
-                    "topP": 0.8,
-                    "maxOutputTokens": 1024,
-                }
-            }
+            response_text = await self._post_gemini(parts)
+            if response_text is None:
+                return None
+            
+            signal = self._parse_gemini_response(response_text, content, source)
+            if signal:
+                print(f"✅ Gemini successfully parsed signal: {signal.symbol} {signal.action}")
+                return signal
             
-            # Make API request
-            url = f"https://generativelanguage.googleapis.com/v1beta/models/gemini-1.5-flash-latest:generateContent?key={self.gemini_api_key}"
+            print("❌ Gemini parsing failed - no valid signal found")
+            return None
             
-            response = requests.post(
+        except Exception as e:
+            self.error_handler.handle_exception(e, "Gemini AI parsing")
+            return None
+    
+    async def _post_gemini(self, parts: List[Dict[str, Any]], max_output_tokens: int = 1024) -> Optional[str]:
+        """Send one generateContent request and return the model's text"""
+        await self.rate_limiter.wait_if_needed()
+        
+        payload = {
+            "contents": [{"parts": parts}],
+            "generationConfig": {
+                "temperature": 0.1,
+                "topK": 1,
+                "topP": 0.8,
+                "maxOutputTokens": max_output_tokens,
+            }
+        }
+        
+        # Make API request
+        url = f"https://generativelanguage.googleapis.com/v1beta/models/gemini-1.5-flash-latest:generateContent?key={self.gemini_api_key}"
+        
+        # Blocking call runs in a worker thread so concurrent parses overlap
+        async with self._gemini_slots:
+            response = await asyncio.to_thread(
+                self.session.post,
                 url,
                 headers={"Content-Type": "application/json"},
-                json=payload,
+                # Serialized up front: the payload can carry megabytes of base64 image data
+                data=fast_json.dumps_bytes(payload),
                 timeout=30
             )
-            
-            if response.status_code == 200:
-                result = response.json()
-                
-                if 'candidates' in result and result['candidates']:
-                    response_text = result['candidates'][0]['content']['parts'][0]['text']
-                    signal = self._parse_gemini_response(response_text, content, source)
-                    
-                    if signal:
-                        print(f"✅ Gemini successfully parsed signal: {signal.symbol} {signal.action}")
-                        return signal
-                    else:
-                        print("❌ Gemini parsing failed - no valid signal found")
-                else:
-                    print("❌ Gemini API returned no candidates")
-            else:
-                print(f"❌ Gemini API error: {response.status_code} - {response.text}")
-            
+        
+        if response.status_code != 200:
+            print(f"❌ Gemini API error: {response.status_code} - {response.text}")
             return None
-            
+        
+        result = fast_json.loads(response.content)
+        if 'candidates' in result and result['candidates']:
+            return result['candidates'][0]['content']['parts'][0]['text']
+        
+        print("❌ Gemini API returned no candidates")
+        return None
+    
+    async def _parse_text_batched(self, content: str, source: str) -> Optional[TradeSignal]:
+        """Queue a text signal for the next coalesced Gemini request"""
+        if self._gemini_batch_task is None:
+            self._gemini_batch_task = asyncio.create_task(self._run_gemini_batches())
+        future = asyncio.get_running_loop().create_future()
+        await self._gemini_batch_queue.put((content, source, future))
+        return await future
+    
+    async def _run_gemini_batches(self) -> None:
+        """Collect queued text signals into batches and start one request per batch"""
+        loop = asyncio.get_running_loop()
+        queue = self._gemini_batch_queue
+        while True:
+            batch = [await queue.get()]
+            deadline = loop.time() + GEMINI_BATCH_MAX_WAIT
+            
+            try:
+                # Only wait for company when a burst is already queued; a lone signal goes out at once
+                while len(batch) < GEMINI_BATCH_MAX_SIZE and (len(batch) > 1 or not queue.empty()):
+                    timeout = deadline - loop.time()
+                    if timeout <= 0:
+                        break
+                    try:
+                        batch.append(await asyncio.wait_for(queue.get(), timeout))
+                    except asyncio.TimeoutError:
+                        break
+            except asyncio.CancelledError:
+                # Shutting down mid-collection - don't leave the collected callers waiting
+                for _, _, future in batch:
+                    if not future.done():
+                        future.set_result(None)
+                raise
+            
+            # Batches run concurrently; the rate limiter and semaphore bound the requests
+            job = asyncio.create_task(self._parse_gemini_batch(batch))
+            self._gemini_batch_jobs.add(job)
+            job.add_done_callback(self._gemini_batch_jobs.discard)
+    
+    async def _parse_gemini_batch(self, batch: List[tuple]) -> None:
+        """Parse a batch with one Gemini request and resolve each caller's future"""
+        try:
+            if len(batch) == 1:
+                content, source, future = batch[0]
+                signal = await self._parse_single_with_gemini(content, None, source)
+                if not future.done():
+                    future.set_result(signal)
+                return
+            
+            signals = await self._request_gemini_batch(batch)
+            if signals is None:
+                # Gemini answered but the answer can't be matched up - retry the signals one request each
+                print(f"⚠️ Gemini batch of {len(batch)} unusable, parsing individually")
+                signals = await asyncio.gather(
+                    *(self._parse_single_with_gemini(content, None, source) for content, source, _ in batch)
+                )
+            
+            for (_, _, future), signal in zip(batch, signals):
+                if not future.done():
+                    future.set_result(signal)
+        
         except Exception as e:
-            self.error_handler.handle_exception(e, "Gemini AI parsing")
+            self.error_handler.handle_exception(e, "Gemini batch parsing")
+        finally:
+            for _, _, future in batch:
+                if not future.done():
+                    future.set_result(None)
+    
+    async def _request_gemini_batch(self, batch: List[tuple]) -> Optional[List[Optional[TradeSignal]]]:
+        """One request for several text signals; None if the answer can't be matched up, all None if Gemini failed"""
+        count = len(batch)
+        parts = [{"text": self._create_gemini_batch_prompt(count)}]
+        parts.extend(
+            {"text": f"Signal {index} content: {content}"}
+            for index, (content, _, _) in enumerate(batch, 1)
+        )
+        
+        response_text = await self._post_gemini(parts, max_output_tokens=max(1024, 256 * count))
+        if response_text is None:
+            # Rate limited or down - per-signal retries would only multiply the load, so
+            # every signal goes to regex fallback parsing instead
+            print(f"⚠️ Gemini request failed - {count} batched signals fall back to regex parsing")
+            return [None] * count
+        
+        json_text = _extract_json(response_text, _JSON_ARRAY_FENCE_RE, _JSON_ARRAY_RE)
+        if json_text is None:
+            return None
+        try:
+            results = fast_json.loads(json_text)
+        except ValueError:
+            return None
+        if not isinstance(results, list) or len(results) != count or not all(isinstance(r, dict) for r in results):
             return None
+        
+        signals = [
+            self._signal_from_gemini_data(data, content, source)
+            for data, (content, source, _) in zip(results, batch)
+        ]
+        
+        # Answers are matched to messages by position only - reject the batch if any answer
+        # names a coin its own message never mentions, rather than trade one message as another
+        for signal, (content, _, _) in zip(signals, batch):
+            if signal and signal.symbol.removesuffix('USDT') not in content.upper():
+                print(f"⚠️ Gemini batch answer {signal.symbol} doesn't match its message")
+                return None
+        
+        print(f"✅ Gemini parsed batch of {count} signals")
+        return signals
     
     async def _download_image(self, image_url: str) -> Optional[str]:
         """Download and encode image for Gemini"""
         try:
-            response = requests.get(image_url, timeout=10)
-            if response.status_code == 200:
-                return base64.b64encode(response.content).decode('utf-8')
-            return None
+            # Download and encode together so the large base64 step stays off the event loop too
+            return await asyncio.to_thread(_fetch_image_base64, self.session, image_url)
         except Exception as e:
             print(f"❌ Error downloading image: {e}")
             return None
@@ -235,27 +678,39 @@ COMMON SIGNAL FORMATS TO RECOGNIZE:
 - Signals with multiple take profit levels (use first TP)
 
 If the content doesn't contain a clear trading signal, return {"signal": null}
+"""
+    
+    def _create_gemini_batch_prompt(self, count: int) -> str:
+        """Prompt for several independent signals answered as one JSON array"""
+        return self._create_gemini_prompt() + f"""
+BATCH MODE:
+You will receive {count} separate messages labeled "Signal 1" to "Signal {count}".
+Parse each one independently using the rules above.
+Return ONLY a JSON array of exactly {count} objects in the same order, each in the REQUIRED JSON FORMAT,
+e.g. [{{"signal": {{...}}}}, {{"signal": null}}]
 """
     
     def _parse_gemini_response(self, response_text: str, original_content: str, source: str) -> Optional[TradeSignal]:
         """Parse Gemini's JSON response into TradeSignal"""
         try:
-            # Clean up the response text
-            response_text = response_text.strip()
-            
             # Extract JSON from response
-            json_start = response_text.find('{')
-            json_end = response_text.rfind('}') + 1
-            
-            if json_start == -1 or json_end == 0:
+            json_text = _extract_json(response_text, _JSON_FENCE_RE, _JSON_OBJECT_RE)
+            if json_text is None:
                 print("❌ No JSON found in Gemini response")
                 return None
             
-            json_text = response_text[json_start:json_end]
-            
             # Parse JSON
-            data = json.loads(json_text)
+            data = fast_json.loads(json_text)
             
+        except json.JSONDecodeError as e:
+            print(f"❌ JSON decode error in Gemini response: {e}")
+            return None
+        
+        return self._signal_from_gemini_data(data, original_content, source)
+    
+    def _signal_from_gemini_data(self, data: Dict[str, Any], original_content: str, source: str) -> Optional[TradeSignal]:
+        """Build and validate a TradeSignal from one decoded {"signal": ...} object"""
+        try:
             if not data.get('signal'):
                 print("ℹ️ Gemini determined no valid signal present")
                 return None
@@ -290,9 +745,6 @@ If the content doesn't contain a clear trading signal, return {"signal": null}
             
             return signal
             
-        except json.JSONDecodeError as e:
-            print(f"❌ JSON decode error in Gemini response: {e}")
-            return None
         except (ValueError, KeyError) as e:
             print(f"❌ Data validation error in Gemini response: {e}")
             return None
@@ -306,19 +758,12 @@ If the content doesn't contain a clear trading signal, return {"signal": null}
             print("🔍 Using fallback regex parsing...")
             
             # Normalize content
-            content = content.upper().replace('/', '').replace('-', '').replace('_', '')
+            content = content.upper().translate(_REGEX_SEPARATORS)
             
             # Extract symbol
-            symbol_patterns = [
-                r'#([A-Z]{2,6})USDT',
-                r'([A-Z]{2,6})USDT',
-                r'([A-Z]{2,6})/USDT',
-                r'#([A-Z]{2,6})'
-            ]
-            
             symbol = None
-            for pattern in symbol_patterns:
-                match = re.search(pattern, content)
+            for pattern in _REGEX_SYMBOL_PATTERNS:
+                match = pattern.search(content)
                 if match:
                     symbol = match.group(1) + 'USDT'
                     break
@@ -329,23 +774,17 @@ If the content doesn't contain a clear trading signal, return {"signal": null}
             
             # Extract action
             action = 'buy'  # Default
-            if any(word in content for word in ['SHORT', 'SELL', 'BEAR']):
+            # One scan per word group instead of one substring search per word
+            if _REGEX_SHORT_WORDS.search(content):
                 action = 'sell'
-            elif any(word in content for word in ['LONG', 'BUY', 'BULL']):
+            elif _REGEX_LONG_WORDS.search(content):
                 action = 'buy'
             
             # Extract prices
-            price_patterns = [
-                r'ENTRY[:\s]*(\d+\.?\d*)',
-                r'BUY[:\s]*(\d+\.?\d*)',
-                r'PRICE[:\s]*(\d+\.?\d*)',
-                r'(\d+\.?\d*)'  # Any number as fallback
-            ]
-            
             prices = []
             for line in content.split('\\n'):
-                for pattern in price_patterns:
-                    matches = re.findall(pattern, line)
+                for pattern in _REGEX_PRICE_PATTERNS:
+                    matches = pattern.findall(line)
                     for match in matches:
                         try:
                             price = float(match)
@@ -364,7 +803,7 @@ If the content doesn't contain a clear trading signal, return {"signal": null}
             take_profit = prices[2]
             
             # Extract leverage
-            leverage_match = re.search(r'(\d+)X|LEVERAGE[:\s]*(\d+)', content)
+            leverage_match = _REGEX_LEVERAGE.search(content)
             leverage = 10  # Default
             if leverage_match:
                 leverage = int(leverage_match.group(1) or leverage_match.group(2))
@@ -396,46 +835,11 @@ If the content doesn't contain a clear trading signal, return {"signal": null}
     def _validate_signal_logic(self, signal: TradeSignal) -> bool:
         """Validate signal logic and price relationships"""
         try:
-            # Basic price validation
-            if signal.entry_price <= 0 or signal.stop_loss <= 0 or signal.take_profit <= 0:
-                return False
-            
-            # Check price relationships for buy signals
-            if signal.action == 'buy':
-                # Stop loss should be below entry, take profit above
-                if signal.stop_loss >= signal.entry_price:
-                    print(f"⚠️ Invalid buy signal: SL ({signal.stop_loss}) >= Entry ({signal.entry_price})")
-                    return False
-                if signal.take_profit <= signal.entry_price:
-                    print(f"⚠️ Invalid buy signal: TP ({signal.take_profit}) <= Entry ({signal.entry_price})")
-                    return False
-            
-            # Check price relationships for sell signals
-            elif signal.action == 'sell':
-                # Stop loss should be above entry, take profit below
-                if signal.stop_loss <= signal.entry_price:
-                    print(f"⚠️ Invalid sell signal: SL ({signal.stop_loss}) <= Entry ({signal.entry_price})")
-                    return False
-                if signal.take_profit >= signal.entry_price:
-                    print(f"⚠️ Invalid sell signal: TP ({signal.take_profit}) >= Entry ({signal.entry_price})")
-                    return False
-            
-            # Check leverage
-            if signal.leverage < 1 or signal.leverage > 125:
-                print(f"⚠️ Invalid leverage: {signal.leverage}")
-                return False
-            
-            # Check that stop loss and take profit aren't too close to entry
-            entry = signal.entry_price
-            sl_distance = abs(signal.stop_loss - entry) / entry
-            tp_distance = abs(signal.take_profit - entry) / entry
-            
-            if sl_distance < 0.001:  # Less than 0.1%
-                print(f"⚠️ Stop loss too close to entry: {sl_distance*100:.3f}%")
-                return False
-            
-            if tp_distance < 0.001:  # Less than 0.1%
-                print(f"⚠️ Take profit too close to entry: {tp_distance*100:.3f}%")
+            reason, sl_distance, tp_distance = check_signal_levels(
+                signal.action, signal.entry_price, signal.stop_loss, signal.take_profit, signal.leverage
+            )
+            if reason:
+                print(f"⚠️ {reason}")
                 return False
             
             print(f"✅ Signal validation passed: SL {sl_distance*100:.1f}%, TP {tp_distance*100:.1f}%")
@@ -0,0 +1,73 @@
+"""
+Tests for fast_path step rounding - quantities and prices must come out exactly on the exchange grid
+"""
+
+import os
+import sys
+from decimal import Decimal, ROUND_DOWN
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fast_path import floor_to_step, round_to_step, step_decimals, default_step, format_quantity, parse_symbol_limits
+
+
+@pytest.mark.parametrize("step, decimals", [
+    (1.0, 0), (0.1, 1), (0.001, 3), (0.00001, 5), (0.000001, 6), (0.00000001, 8),
+])
+def test_step_decimals(step, decimals):
+    assert step_decimals(step) == decimals
+
+
+@pytest.mark.parametrize("step_text", ["0.01", "0.001", "0.00001", "0.000001", "0.0000001", "0.00000001"])
+@pytest.mark.parametrize("quantity", [0.29, 0.29000000001, 123.45678912, 1.0, 0.000123456789, 98765.4321])
+def test_floor_to_step_matches_decimal_quantize(step_text, quantity):
+    step = float(step_text)
+    result = floor_to_step(quantity, step, step_decimals(step))
+
+    expected = Decimal(repr(quantity)).quantize(Decimal(step_text), rounding=ROUND_DOWN)
+    assert Decimal(repr(result)) == expected
+    # What create_order puts on the wire must carry no float noise
+    assert Decimal(format_quantity(result)) == expected
+    assert len(format_quantity(result).partition('.')[2]) <= step_decimals(step)
+
+
+def test_floor_to_step_whole_step_not_lost_to_float_error():
+    # 0.29 / 0.01 = 28.999999999999996
+    assert floor_to_step(0.29, 0.01, 2) == 0.29
+
+
+def test_default_step():
+    assert default_step(5.0) == 0.001
+    assert default_step(0.5) == 0.00001
+
+
+@pytest.mark.parametrize("quantity, text", [
+    (0.29, "0.29"), (0.00005, "0.00005"), (0.00000001, "0.00000001"), (12.0, "12.0"), (1234.5, "1234.5"),
+])
+def test_format_quantity_never_scientific(quantity, text):
+    assert format_quantity(quantity) == text
+
+
+@pytest.mark.parametrize("price, tick_text, text", [
+    (0.1 + 0.2, "0.01", "0.3"),
+    (0.000012345678, "0.0000001", "0.0000123"),
+    (0.00001236, "0.0000001", "0.0000124"),
+    (65432.17, "0.1", "65432.2"),
+    (1.2345, "0.0001", "1.2345"),
+])
+def test_round_to_step_gives_plain_tick_aligned_price(price, tick_text, text):
+    tick = float(tick_text)
+    rounded = round_to_step(price, tick, step_decimals(tick))
+    assert format_quantity(rounded) == text
+    assert Decimal(text) % Decimal(tick_text) == 0
+
+
+def test_parse_symbol_limits_reads_price_filter_tick():
+    limits = parse_symbol_limits({'filters': [
+        {'filterType': 'PRICE_FILTER', 'tickSize': '0.00010'},
+        {'filterType': 'LOT_SIZE', 'minQty': '1', 'maxQty': '1000', 'stepSize': '1'},
+    ]})
+    assert limits['tick_size'] == 0.0001
+    assert limits['step_size'] == 1.0
@@ -4,8 +4,8 @@ Handles trade validation, position sizing, and TP/SL order placement
 """
 
 import asyncio
-import json
 import os
+import time
 from typing import Dict, List, Optional, Tuple, Any
 from datetime import datetime
 # Use HTTP fallback for Termux compatibility
@@ -17,6 +17,7 @@ except ImportError:
     from exchange_connector_http import ExchangeConnectorHTTP as ExchangeConnector
 from config_manager import Config
 from error_handler import get_error_handler
+import fast_json
 
 
 class TradeManager:
@@ -107,7 +108,7 @@ class TradeManager:
     async def _execute_signal(self, signal: TradeSignal) -> bool:
         """Execute trading signal"""
         try:
-            start_time = datetime.now()
+            start_time = time.monotonic()
             self.error_handler.log_info(f"🚀 Starting execution of {signal.symbol} {signal.direction}")
             
             self.error_handler.log_info(f"📋 Validating signal for {signal.symbol}")
@@ -124,7 +125,7 @@ class TradeManager:
             self.error_handler.log_info(f"📈 Placing orders for {signal.symbol} (size: {position_size})")
             success = await self._place_trade_orders(signal, position_size)
             
-            execution_time = (datetime.now() - start_time).total_seconds()
+            execution_time = time.monotonic() - start_time
             if execution_time > 3.0:
                 self.error_handler.log_warning(
                     f"Slow signal execution: {execution_time:.2f}s (target: <3s)"
@@ -229,7 +230,7 @@ class TradeManager:
                 return True
             
             with open(trades_file, 'r') as f:
-                trades = json.load(f)
+                trades = fast_json.loads(f.read())
             
             daily_pnl = 0
             for trade in trades:
@@ -344,9 +345,11 @@ class TradeManager:
             
             self.error_handler.log_success(f"✅ Entry order placed successfully for {signal.symbol}: {entry_order.get('id', 'unknown_id')}")
             
-            # Always place TP/SL orders immediately after entry order
-            await self._place_tp_orders(signal, position_size)
-            await self._place_sl_order(signal, position_size)
+            # Always place TP/SL orders immediately after entry order, TP and SL legs in parallel
+            await asyncio.gather(
+                self._place_tp_orders(signal, position_size),
+                self._place_sl_order(signal, position_size)
+            )
             
             # Save to positions.json for tracking (will be properly handled by position tracker)
             await self._save_position_to_file(signal, position_size, entry_order)
@@ -488,7 +491,7 @@ class TradeManager:
             
             if os.path.exists(positions_file):
                 with open(positions_file, 'r') as f:
-                    positions = json.load(f)
+                    positions = fast_json.loads(f.read())
             
             position_data = {
                 'symbol': signal.symbol,
@@ -508,7 +511,7 @@ class TradeManager:
             positions[signal.symbol] = position_data
             
             with open(positions_file, 'w') as f:
-                json.dump(positions, f, indent=2)
+                f.write(fast_json.dumps(positions, indent=True))
                 
         except Exception as e:
             self.error_handler.handle_exception(e, "saving position to file")
@@ -4,9 +4,8 @@ Updates positions.json and trades.json, reports events via Telegram
 """
 
 import asyncio
-import json
 import os
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 from datetime import datetime, timedelta
 # Use HTTP fallback for Termux compatibility
 try:
@@ -15,6 +14,7 @@ except ImportError:
     from exchange_connector_http import ExchangeConnectorHTTP as ExchangeConnector
 from config_manager import Config
 from error_handler import get_error_handler
+import fast_json
 
 
 class TradeTracker:
@@ -61,7 +61,13 @@ class TradeTracker:
     async def _update_positions(self) -> None:
         """Update position statuses and detect changes"""
         try:
-            current_positions = await self.exchange.get_open_positions()
+            try:
+                current_positions = await self.exchange.get_open_positions()
+            except Exception as e:
+                # A failed fetch says nothing about which positions closed - never reconcile against it
+                self.error_handler.handle_exception(e, "fetching positions - skipping reconciliation")
+                return
+            
             local_positions = self._load_local_positions()
             
             for symbol, local_pos in local_positions.items():
@@ -138,7 +144,7 @@ class TradeTracker:
                 
                 positions_file = "positions.json"
                 with open(positions_file, 'w') as f:
-                    json.dump(positions, f, indent=2)
+                    f.write(fast_json.dumps(positions, indent=True))
                     
         except Exception as e:
             self.error_handler.handle_exception(e, f"marking position confirmed {symbol}")
@@ -387,7 +393,7 @@ class TradeTracker:
             
             if os.path.exists(trades_file):
                 with open(trades_file, 'r') as f:
-                    trades = json.load(f)
+                    trades = fast_json.loads(f.read())
             
             start_time = datetime.fromisoformat(position['timestamp'])
             end_time = datetime.fromisoformat(position['close_time'])
@@ -412,7 +418,7 @@ class TradeTracker:
             trades.append(trade_record)
             
             with open(trades_file, 'w') as f:
-                json.dump(trades, f, indent=2)
+                f.write(fast_json.dumps(trades, indent=True))
                 
         except Exception as e:
             self.error_handler.handle_exception(e, "saving trade history")
@@ -423,7 +429,7 @@ class TradeTracker:
             positions_file = "positions.json"
             if os.path.exists(positions_file):
                 with open(positions_file, 'r') as f:
-                    return json.load(f)
+                    return fast_json.loads(f.read())
             return {}
         except Exception as e:
             self.error_handler.handle_exception(e, "loading local positions")
@@ -433,7 +439,7 @@ class TradeTracker:
         """Save positions to local file"""
         try:
             with open("positions.json", 'w') as f:
-                json.dump(positions, f, indent=2)
+                f.write(fast_json.dumps(positions, indent=True))
         except Exception as e:
             self.error_handler.handle_exception(e, "saving local positions")
     
@@ -475,6 +481,14 @@ class TradeTracker:
             self.error_handler.handle_exception(e, "getting positions summary")
             return "Error getting positions summary"
     
+    async def get_dashboard(self) -> Tuple[str, Dict[str, Any]]:
+        """Get positions summary and trade statistics in one concurrent fetch"""
+        summary, stats = await asyncio.gather(
+            self.get_active_positions_summary(),
+            self.get_trade_statistics()
+        )
+        return summary, stats
+    
     async def get_trade_statistics(self) -> Dict[str, Any]:
         """Get trading statistics"""
         try:
@@ -483,7 +497,7 @@ class TradeTracker:
                 return {"total_trades": 0, "total_pnl": 0, "win_rate": 0}
             
             with open(trades_file, 'r') as f:
-                trades = json.load(f)
+                trades = fast_json.loads(f.read())
             
             if not trades:
                 return {"total_trades": 0, "total_pnl": 0, "win_rate": 0}